@@ -0,0 +1,21 @@
+"""
+Optional Numba JIT shim.
+
+``njit`` is ``numba.njit`` when Numba is installed and a no-op decorator
+otherwise, so kernels can be declared unconditionally and callers check
+``NUMBA_AVAILABLE`` to decide whether to use them.
+"""
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that returns the function unchanged."""
+        if len ( args ) == 1 and callable ( args[0] ) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -6,58 +6,378 @@ This script demonstrates various ways to use the StockAnalyzer class
 for different types of market analysis.
 """
 
-from stock_analyzer import StockAnalyzer
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Type
+import argparse
+import io
 import logging
+import os
+import re
+import sys
+import threading
+
+# Examples only write chart files, so use the non-interactive Agg backend rather
+# than letting matplotlib probe for a GUI toolkit when it is first imported
+os.environ.setdefault ( 'MPLBACKEND', 'Agg' )
+
+# stock_analyzer, pandas, numpy and yfinance are imported inside the functions
+# that use them, so importing this module or running --help stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    from stock_analyzer import StockAnalyzer
+
+logger = logging.getLogger ( __name__ )
+
+# Longest period requested by any example; shorter periods are sliced from it
+FETCH_PERIOD = '5y'
+
+# In-process cache of downloaded price history, keyed by (symbol, period)
+_fetch_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+_fetch_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+# Serializes writes to the shared report/chart files and pyplot's global state
+# while examples run concurrently
+_output_files_lock = threading.Lock ()
+
+# Per-thread buffer that captures an example's printed output
+_example_output = threading.local ()
+
+# Fields StockAnalyzer.analyze_trends records for each symbol
+ANALYSIS_COLUMNS = [
+    'ma_signal', 'rsi_value', 'rsi_signal', 'macd_signal', 'bb_signal',
+    'score', 'recommendation', 'current_price', 'volatility', 'sector'
+]
+
+
+def _period_months(period: str) -> Optional[int]:
+    """Convert a month/year yfinance period string (e.g. 6mo, 2y) to months."""
+    match = re.fullmatch ( r'(\d+)(mo|y)', period )
+    if not match:
+        return None
+    return int ( match.group ( 1 ) ) * (1 if match.group ( 2 ) == 'mo' else 12)
+
+
+def _download_period(period: str) -> str:
+    """Return the period actually downloaded (and cached) for a requested period."""
+    months = _period_months ( period )
+    if months is not None and months <= _period_months ( FETCH_PERIOD ):
+        return FETCH_PERIOD
+    return period
+
+
+def prefetch(symbols: List[str], period: str) -> None:
+    """
+    Download every symbol not yet cached for a period in one batched request.
+
+    Args:
+        symbols: Ticker symbols to fetch
+        period: yfinance period string (e.g. 1y, 2y, 5y)
+    """
+    download_period = _download_period ( period )
+    missing = [symbol for symbol in symbols if (symbol, download_period) not in _fetch_cache]
+    if not missing:
+        return
+
+    import pandas as pd
+    import yfinance as yf
+
+    try:
+        data = yf.download ( ' '.join ( missing ), period=download_period, group_by='ticker',
+                             auto_adjust=True, actions=True, ignore_tz=False,
+                             threads=True, progress=False )
+    except Exception as e:
+        # Symbols left uncached are fetched one at a time by cached_fetch
+        logger.warning ( f"Batch download failed, falling back to per-symbol fetches - {str ( e )}" )
+        return
+
+    for symbol in missing:
+        if isinstance ( data.columns, pd.MultiIndex ):
+            if symbol not in data.columns.get_level_values ( 0 ):
+                continue
+            frame = data[symbol]
+        else:
+            frame = data
+        _fetch_cache.setdefault ( (symbol, download_period), frame.dropna ( subset=['Close'] ) )
+
+
+def cached_fetch(symbol: str, period: str) -> pd.DataFrame:
+    """
+    Fetch price history for a symbol, reusing earlier downloads from this run.
+
+    Month/year periods up to FETCH_PERIOD share a single download per symbol
+    and are sliced locally; any other period is cached under its own key.
+
+    Args:
+        symbol: Ticker symbol to fetch
+        period: yfinance period string (e.g. 1y, 2y, 5y)
+
+    Returns:
+        pd.DataFrame: A copy of the cached price history for the period
+    """
+    import pandas as pd
+    import yfinance as yf
+
+    download_period = _download_period ( period )
+    key = (symbol, download_period)
+
+    # One lock per key so concurrent examples sharing a ticker download it once
+    with _fetch_locks.setdefault ( key, threading.Lock () ):
+        if key not in _fetch_cache:
+            _fetch_cache[key] = yf.Ticker ( symbol ).history ( period=download_period )
+
+    data = _fetch_cache[key]
+    if download_period != period and not data.empty:
+        start = data.index[-1] - pd.DateOffset ( months=_period_months ( period ) )
+        data = data[data.index >= start]
+    return data.copy ()
+
+
+@lru_cache ( maxsize=None )
+def _cached_analyzer_class() -> Type[StockAnalyzer]:
+    """Define the caching StockAnalyzer subclass on first use, importing stock_analyzer lazily."""
+    from stock_analyzer import StockAnalyzer
+
+    class CachedStockAnalyzer(StockAnalyzer):
+        """StockAnalyzer that batch-downloads its symbols and serves them from the run cache."""
+
+        def fetch_stock_data(self, period: str = '5y') -> bool:
+            prefetch ( list ( self.stocks.keys () ), period )
+            return super ().fetch_stock_data ( period=period )
+
+        def _download_history(self, symbol: str, period: str) -> pd.DataFrame:
+            return cached_fetch ( symbol, period )
+
+        def create_visualizations(self) -> None:
+            with _output_files_lock:
+                super ().create_visualizations ()
+
+        def generate_report(self) -> str:
+            with _output_files_lock:
+                return super ().generate_report ()
+
+    return CachedStockAnalyzer
+
+
+def cached_analyzer(custom_stocks: Optional[Dict[str, str]] = None) -> StockAnalyzer:
+    """
+    Create a StockAnalyzer whose downloads go through the run cache.
+
+    Args:
+        custom_stocks: Dictionary of {symbol: description} for custom analysis
+
+    Returns:
+        StockAnalyzer: Instance of the caching subclass
+    """
+    return _cached_analyzer_class () ( custom_stocks=custom_stocks )
+
+
+class _ThreadBufferedStdout:
+    """Stdout proxy that sends writes to the calling thread's example buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = getattr ( _example_output, 'buffer', None )
+        return (buffer if buffer is not None else self._stream).write ( text )
+
+    def flush(self) -> None:
+        self._stream.flush ()
+
+    def __getattr__(self, name):
+        return getattr ( self._stream, name )
+
+
+def _run_buffered(example: Callable[[], None]) -> str:
+    """Run an example and return everything it printed."""
+    _example_output.buffer = io.StringIO ()
+    try:
+        example ()
+        return _example_output.buffer.getvalue ()
+    finally:
+        del _example_output.buffer
+
+
+def _analysis_frame(analyzer: StockAnalyzer) -> pd.DataFrame:
+    """Collect an analyzer's per-symbol analysis results into a DataFrame indexed by symbol."""
+    import pandas as pd
+
+    return pd.DataFrame.from_dict ( analyzer.analysis_results, orient='index',
+                                    columns=ANALYSIS_COLUMNS )
+
+
+def _candidate_lines(candidates: pd.DataFrame) -> List[str]:
+    """Format one screening line per candidate row."""
+    return [
+        f"{symbol}: {recommendation} (Score: {score:+d}, RSI: {rsi:.1f}, Price: ${price:.2f})"
+        for symbol, recommendation, score, rsi, price in zip (
+            candidates.index, candidates['recommendation'], candidates['score'],
+            candidates['rsi_value'], candidates['current_price'] )
+    ]
+
+
+# Define custom stocks for analysis
+TECH_STOCKS = {
+    'GOOGL': 'Alphabet Inc. - Technology',
+    'META': 'Meta Platforms Inc. - Technology',
+    'NFLX': 'Netflix Inc. - Communication Services',
+    'ADBE': 'Adobe Inc. - Technology',
+    'CRM': 'Salesforce Inc. - Technology',
+    'PYPL': 'PayPal Holdings Inc. - Financial Technology'
+}
+
+# Define dividend-focused stocks
+DIVIDEND_STOCKS = {
+    'KO': 'The Coca-Cola Company - Consumer Staples',
+    'PEP': 'PepsiCo Inc. - Consumer Staples',
+    'JNJ': 'Johnson & Johnson - Healthcare',
+    'PG': 'Procter & Gamble Co. - Consumer Staples',
+    'VZ': 'Verizon Communications Inc. - Telecommunications',
+    'T': 'AT&T Inc. - Telecommunications'
+}
+
+# Define stocks from various sectors
+DIVERSIFIED_PORTFOLIO = {
+    # Technology
+    'AAPL': 'Apple Inc. - Technology',
+    'MSFT': 'Microsoft Corporation - Technology',
+
+    # Healthcare
+    'UNH': 'UnitedHealth Group Inc. - Healthcare',
+    'PFE': 'Pfizer Inc. - Healthcare',
+
+    # Financial
+    'JPM': 'JPMorgan Chase & Co. - Financial',
+    'BAC': 'Bank of America Corp. - Financial',
+
+    # Consumer Discretionary
+    'AMZN': 'Amazon.com Inc. - Consumer Discretionary',
+    'HD': 'The Home Depot Inc. - Consumer Discretionary',
+
+    # Energy
+    'XOM': 'Exxon Mobil Corporation - Energy',
+    'CVX': 'Chevron Corporation - Energy'
+}
+
+# Large cap stocks for screening
+LARGE_CAPS = {
+    'AAPL': 'Apple Inc.',
+    'MSFT': 'Microsoft Corporation',
+    'GOOGL': 'Alphabet Inc.',
+    'AMZN': 'Amazon.com Inc.',
+    'TSLA': 'Tesla Inc.',
+    'META': 'Meta Platforms Inc.',
+    'NVDA': 'NVIDIA Corporation',
+    'BRK-B': 'Berkshire Hathaway Inc.',
+    'V': 'Visa Inc.',
+    'JNJ': 'Johnson & Johnson'
+}
+
+
+def build_shared_analyzer() -> StockAnalyzer:
+    """
+    Fetch and analyze every example ticker once, at FETCH_PERIOD.
+
+    Returns:
+        StockAnalyzer: Analyzer holding trend analysis for all example tickers
+    """
+    from stock_analyzer import StockAnalyzer
+
+    # Every ticker used by the examples; descriptions with a sector take precedence
+    all_stocks = {
+        **LARGE_CAPS, **TECH_STOCKS, **DIVIDEND_STOCKS,
+        **DIVERSIFIED_PORTFOLIO, **StockAnalyzer.DEFAULT_STOCKS
+    }
+
+    shared = cached_analyzer ( custom_stocks=all_stocks )
+    if not shared.fetch_stock_data ( period=FETCH_PERIOD ):
+        raise Exception ( "Failed to fetch stock data" )
+
+    shared.clean_and_preprocess_data ()
+    shared.calculate_technical_indicators ()
+    shared.analyze_trends ()
+    return shared
+
 
-# Configure logging to see detailed output
-logging.basicConfig ( level=logging.INFO )
+def _analyzer_view(shared: StockAnalyzer, stocks: Dict[str, str]) -> StockAnalyzer:
+    """
+    Build an analyzer for ``stocks`` from a shared analyzer's results.
+
+    Args:
+        shared: Analyzer that has already run trend analysis
+        stocks: Dictionary of {symbol: description} for this example
+
+    Returns:
+        StockAnalyzer: Analyzer with the matching data and results
+    """
+    view = cached_analyzer ( custom_stocks=stocks )
+    for symbol in stocks:
+        if symbol in shared.analysis_results:
+            view.stock_data[symbol] = shared.stock_data[symbol]
+            view.analysis_results[symbol] = dict ( shared.analysis_results[symbol],
+                                                   sector=view._get_sector ( symbol ) )
+    return view
 
 
-def basic_analysis_example():
+def basic_analysis_example(make_plots: bool = True, shared: Optional[StockAnalyzer] = None):
     """
     Example 1: Basic analysis with default stocks
+
+    Args:
+        make_plots: Generate the chart files alongside the text report
+        shared: Analyzer whose results are reused instead of re-running the pipeline
     """
     print ( "=" * 60 )
     print ( "EXAMPLE 1: Basic Analysis with Default Stocks" )
     print ( "=" * 60 )
 
-    # Initialize analyzer with default stocks
-    analyzer = StockAnalyzer ()
+    from stock_analyzer import StockAnalyzer
+
+    if shared is not None:
+        analyzer = _analyzer_view ( shared, StockAnalyzer.DEFAULT_STOCKS )
+        if make_plots:
+            analyzer.create_visualizations ()
+        report = analyzer.generate_report ()
+    else:
+        # Initialize analyzer with default stocks
+        analyzer = cached_analyzer ()
 
-    # Run complete analysis
-    report = analyzer.run_complete_analysis ()
+        # Run complete analysis
+        report = analyzer.run_complete_analysis ( make_plots=make_plots )
 
     # Print summary
     analyzer.print_summary ()
 
 
-def custom_stocks_example():
+def custom_stocks_example(make_plots: bool = False, shared: Optional[StockAnalyzer] = None):
     """
     Example 2: Analysis with custom stock selection
+
+    Args:
+        make_plots: Generate the chart files alongside the text report
+        shared: Analyzer whose results are reused instead of re-running the pipeline
     """
     print ( "\n" + "=" * 60 )
     print ( "EXAMPLE 2: Custom Stock Selection" )
     print ( "=" * 60 )
 
-    # Define custom stocks for analysis
-    tech_stocks = {
-        'GOOGL': 'Alphabet Inc. - Technology',
-        'META': 'Meta Platforms Inc. - Technology',
-        'NFLX': 'Netflix Inc. - Communication Services',
-        'ADBE': 'Adobe Inc. - Technology',
-        'CRM': 'Salesforce Inc. - Technology',
-        'PYPL': 'PayPal Holdings Inc. - Financial Technology'
-    }
+    if shared is not None:
+        analyzer = _analyzer_view ( shared, TECH_STOCKS )
+    else:
+        # Initialize analyzer with custom stocks
+        analyzer = cached_analyzer ( custom_stocks=TECH_STOCKS )
 
-    # Initialize analyzer with custom stocks
-    analyzer = StockAnalyzer ( custom_stocks=tech_stocks )
+        # Run analysis with shorter time period
+        analyzer.fetch_stock_data ( period='2y' )
+        analyzer.clean_and_preprocess_data ()
+        analyzer.calculate_technical_indicators ()
+        analyzer.analyze_trends ()
 
-    # Run analysis with shorter time period
-    analyzer.fetch_stock_data ( period='2y' )
-    analyzer.clean_and_preprocess_data ()
-    analyzer.calculate_technical_indicators ()
-    analyzer.analyze_trends ()
-    analyzer.create_visualizations ()
+    if make_plots:
+        analyzer.create_visualizations ()
     report = analyzer.generate_report ()
 
     # Print tech sector summary
@@ -66,48 +386,49 @@ def custom_stocks_example():
     analyzer.print_summary ()
 
 
-def step_by_step_example():
+def step_by_step_example(make_plots: bool = False, shared: Optional[StockAnalyzer] = None):
     """
     Example 3: Step-by-step analysis with custom configuration
+
+    Args:
+        make_plots: Generate the chart files alongside the text report
+        shared: Analyzer whose results are reused instead of re-running steps 1-4
     """
     print ( "\n" + "=" * 60 )
     print ( "EXAMPLE 3: Step-by-Step Custom Analysis" )
     print ( "=" * 60 )
 
-    # Define dividend-focused stocks
-    dividend_stocks = {
-        'KO': 'The Coca-Cola Company - Consumer Staples',
-        'PEP': 'PepsiCo Inc. - Consumer Staples',
-        'JNJ': 'Johnson & Johnson - Healthcare',
-        'PG': 'Procter & Gamble Co. - Consumer Staples',
-        'VZ': 'Verizon Communications Inc. - Telecommunications',
-        'T': 'AT&T Inc. - Telecommunications'
-    }
-
-    analyzer = StockAnalyzer ( custom_stocks=dividend_stocks )
+    if shared is not None:
+        print ( "Steps 1-4: Reusing shared analysis results..." )
+        analyzer = _analyzer_view ( shared, DIVIDEND_STOCKS )
+    else:
+        analyzer = cached_analyzer ( custom_stocks=DIVIDEND_STOCKS )
 
-    # Step 1: Fetch data
-    print ( "Step 1: Fetching stock data..." )
-    success = analyzer.fetch_stock_data ( period='3y' )
-    if not success:
-        print ( "Failed to fetch data. Exiting." )
-        return
+        # Step 1: Fetch data
+        print ( "Step 1: Fetching stock data..." )
+        success = analyzer.fetch_stock_data ( period='3y' )
+        if not success:
+            print ( "Failed to fetch data. Exiting." )
+            return
 
-    # Step 2: Clean data
-    print ( "Step 2: Cleaning and preprocessing data..." )
-    analyzer.clean_and_preprocess_data ()
+        # Step 2: Clean data
+        print ( "Step 2: Cleaning and preprocessing data..." )
+        analyzer.clean_and_preprocess_data ()
 
-    # Step 3: Calculate indicators
-    print ( "Step 3: Calculating technical indicators..." )
-    analyzer.calculate_technical_indicators ()
+        # Step 3: Calculate indicators
+        print ( "Step 3: Calculating technical indicators..." )
+        analyzer.calculate_technical_indicators ()
 
-    # Step 4: Analyze trends
-    print ( "Step 4: Performing trend analysis..." )
-    analyzer.analyze_trends ()
+        # Step 4: Analyze trends
+        print ( "Step 4: Performing trend analysis..." )
+        analyzer.analyze_trends ()
 
     # Step 5: Create visualizations (optional)
-    print ( "Step 5: Generating visualizations..." )
-    analyzer.create_visualizations ()
+    if make_plots:
+        print ( "Step 5: Generating visualizations..." )
+        analyzer.create_visualizations ()
+    else:
+        print ( "Step 5: Skipping visualizations" )
 
     # Step 6: Generate report
     print ( "Step 6: Creating analysis report..." )
@@ -117,150 +438,138 @@ def step_by_step_example():
     print ( "\nDividend Stocks Analysis:" )
     print ( "-" * 40 )
 
-    # Show detailed analysis for each stock
-    for symbol, analysis in analyzer.analysis_results.items ():
-        print ( f"\n{symbol} - {analyzer.stocks[symbol]}" )
-        print ( f"  Current Price: ${analysis['current_price']:.2f}" )
-        print ( f"  Recommendation: {analysis['recommendation']}" )
-        print ( f"  RSI: {analysis['rsi_value']:.1f} ({analysis['rsi_signal']})" )
-        print ( f"  Volatility: {analysis['volatility']:.2f}" )
+    # Show detailed analysis for each stock as a single table
+    results = _analysis_frame ( analyzer )[
+        ['current_price', 'recommendation', 'rsi_value', 'rsi_signal', 'volatility']
+    ]
+    print ( results.to_string ( formatters={
+        'current_price': '${:.2f}'.format,
+        'rsi_value': '{:.1f}'.format,
+        'volatility': '{:.2f}'.format
+    } ) )
 
 
-def sector_analysis_example():
+def sector_analysis_example(make_plots: bool = False, shared: Optional[StockAnalyzer] = None):
     """
     Example 4: Multi-sector analysis
+
+    Args:
+        make_plots: Generate the chart files alongside the text report
+        shared: Analyzer whose results are reused instead of re-running the pipeline
     """
     print ( "\n" + "=" * 60 )
     print ( "EXAMPLE 4: Multi-Sector Analysis" )
     print ( "=" * 60 )
 
-    # Define stocks from various sectors
-    diversified_portfolio = {
-        # Technology
-        'AAPL': 'Apple Inc. - Technology',
-        'MSFT': 'Microsoft Corporation - Technology',
-
-        # Healthcare
-        'UNH': 'UnitedHealth Group Inc. - Healthcare',
-        'PFE': 'Pfizer Inc. - Healthcare',
-
-        # Financial
-        'JPM': 'JPMorgan Chase & Co. - Financial',
-        'BAC': 'Bank of America Corp. - Financial',
-
-        # Consumer Discretionary
-        'AMZN': 'Amazon.com Inc. - Consumer Discretionary',
-        'HD': 'The Home Depot Inc. - Consumer Discretionary',
-
-        # Energy
-        'XOM': 'Exxon Mobil Corporation - Energy',
-        'CVX': 'Chevron Corporation - Energy'
-    }
-
-    analyzer = StockAnalyzer ( custom_stocks=diversified_portfolio )
-    report = analyzer.run_complete_analysis ()
+    if shared is not None:
+        analyzer = _analyzer_view ( shared, DIVERSIFIED_PORTFOLIO )
+        if make_plots:
+            analyzer.create_visualizations ()
+        report = analyzer.generate_report ()
+    else:
+        analyzer = cached_analyzer ( custom_stocks=DIVERSIFIED_PORTFOLIO )
+        report = analyzer.run_complete_analysis ( make_plots=make_plots )
 
     # Analyze by sector
-    sectors = {}
-    for symbol, description in diversified_portfolio.items ():
-        sector = description.split ( ' - ' )[1]
-        if sector not in sectors:
-            sectors[sector] = []
-        sectors[sector].append ( symbol )
-
-    print ( "\nSector Performance Summary:" )
-    print ( "-" * 50 )
-
-    for sector, symbols in sectors.items ():
-        print ( f"\n{sector.upper ()} SECTOR:" )
-        sector_scores = []
+    results = _analysis_frame ( analyzer )
 
-        for symbol in symbols:
-            if symbol in analyzer.analysis_results:
-                analysis = analyzer.analysis_results[symbol]
-                score = analysis['score']
-                recommendation = analysis['recommendation']
-                price = analysis['current_price']
+    lines = ["\nSector Performance Summary:", "-" * 50]
 
-                print ( f"  {symbol}: {recommendation} (Score: {score:+d}, Price: ${price:.2f})" )
-                sector_scores.append ( score )
+    sector_averages = results.groupby ( 'sector', sort=False )['score'].mean ()
+    for sector, group in results.groupby ( 'sector', sort=False ):
+        lines.append ( f"\n{sector.upper ()} SECTOR:" )
+        lines.extend (
+            f"  {symbol}: {recommendation} (Score: {score:+d}, Price: ${price:.2f})"
+            for symbol, recommendation, score, price in zip (
+                group.index, group['recommendation'], group['score'], group['current_price'] )
+        )
+        lines.append ( f"  → Sector Average Score: {sector_averages[sector]:.1f}" )
 
-        if sector_scores:
-            avg_score = sum ( sector_scores ) / len ( sector_scores )
-            print ( f"  → Sector Average Score: {avg_score:.1f}" )
+    print ( "\n".join ( lines ) )
 
 
-def quick_screening_example():
+def quick_screening_example(shared: Optional[StockAnalyzer] = None):
     """
     Example 5: Quick screening for buy/sell opportunities
+
+    Args:
+        shared: Analyzer whose results are reused instead of re-running the pipeline
     """
     print ( "\n" + "=" * 60 )
     print ( "EXAMPLE 5: Quick Stock Screening" )
     print ( "=" * 60 )
 
-    # Large cap stocks for screening
-    large_caps = {
-        'AAPL': 'Apple Inc.',
-        'MSFT': 'Microsoft Corporation',
-        'GOOGL': 'Alphabet Inc.',
-        'AMZN': 'Amazon.com Inc.',
-        'TSLA': 'Tesla Inc.',
-        'META': 'Meta Platforms Inc.',
-        'NVDA': 'NVIDIA Corporation',
-        'BRK-B': 'Berkshire Hathaway Inc.',
-        'V': 'Visa Inc.',
-        'JNJ': 'Johnson & Johnson'
-    }
-
-    analyzer = StockAnalyzer ( custom_stocks=large_caps )
+    if shared is not None:
+        analyzer = _analyzer_view ( shared, LARGE_CAPS )
+    else:
+        analyzer = cached_analyzer ( custom_stocks=LARGE_CAPS )
 
-    # Quick analysis
-    analyzer.fetch_stock_data ( period='1y' )  # Use 1 year for faster processing
-    analyzer.clean_and_preprocess_data ()
-    analyzer.calculate_technical_indicators ()
-    analyzer.analyze_trends ()
+        # Quick analysis
+        analyzer.fetch_stock_data ( period='1y' )  # Use 1 year for faster processing
+        analyzer.clean_and_preprocess_data ()
+        analyzer.calculate_technical_indicators ()
+        analyzer.analyze_trends ()
 
     # Screen for opportunities
-    buy_candidates = []
-    sell_candidates = []
+    import numpy as np
 
-    for symbol, analysis in analyzer.analysis_results.items ():
-        if "Buy" in analysis['recommendation']:
-            buy_candidates.append ( (symbol, analysis) )
-        elif "Sell" in analysis['recommendation']:
-            sell_candidates.append ( (symbol, analysis) )
+    results = _analysis_frame ( analyzer )
+
+    # Stable sorts keep equal scores in input order: buys by descending score, sells ascending
+    scores = results['score'].to_numpy ( dtype=np.int64 )
+    buy_ranked = results.iloc[np.argsort ( -scores, kind='stable' )]
+    sell_ranked = results.iloc[np.argsort ( scores, kind='stable' )]
+    buy_candidates = buy_ranked[buy_ranked['recommendation'].str.contains ( 'Buy' )]
+    sell_candidates = sell_ranked[sell_ranked['recommendation'].str.contains ( 'Sell' )]
 
     # Display screening results
-    print ( f"\nBUY CANDIDATES ({len ( buy_candidates )} found):" )
-    print ( "-" * 40 )
-    for symbol, analysis in sorted ( buy_candidates, key=lambda x: x[1]['score'], reverse=True ):
-        print ( f"{symbol}: {analysis['recommendation']} (Score: {analysis['score']:+d}, "
-                f"RSI: {analysis['rsi_value']:.1f}, Price: ${analysis['current_price']:.2f})" )
+    lines = [f"\nBUY CANDIDATES ({len ( buy_candidates )} found):", "-" * 40]
+    lines.extend ( _candidate_lines ( buy_candidates ) )
+    lines.extend ( [f"\nSELL CANDIDATES ({len ( sell_candidates )} found):", "-" * 40] )
+    lines.extend ( _candidate_lines ( sell_candidates ) )
 
-    print ( f"\nSELL CANDIDATES ({len ( sell_candidates )} found):" )
-    print ( "-" * 40 )
-    for symbol, analysis in sorted ( sell_candidates, key=lambda x: x[1]['score'] ):
-        print ( f"{symbol}: {analysis['recommendation']} (Score: {analysis['score']:+d}, "
-                f"RSI: {analysis['rsi_value']:.1f}, Price: ${analysis['current_price']:.2f})" )
+    print ( "\n".join ( lines ) )
 
 
 def main():
     """
     Run all examples to demonstrate the tool's capabilities.
     """
+    parser = argparse.ArgumentParser ( description="Run the Stock Market Analyzer usage examples." )
+    parser.add_argument ( '--verbose', action='store_true', help="show detailed progress logging" )
+    args = parser.parse_args ()
+
+    # Configured before stock_analyzer is first imported, so this takes precedence
+    logging.basicConfig ( level=logging.INFO if args.verbose else logging.WARNING,
+                          format='%(asctime)s - %(levelname)s - %(message)s' )
+
     print ( "Stock Market Analyzer - Usage Examples" )
     print ( "=" * 80 )
     print ( "This script demonstrates various ways to use the analyzer." )
     print ( "Each example shows different features and use cases." )
     print ( "=" * 80 )
 
+    stdout = sys.stdout
+    sys.stdout = _ThreadBufferedStdout ( stdout )
     try:
-        # Run all examples
-        basic_analysis_example ()
-        custom_stocks_example ()
-        step_by_step_example ()
-        sector_analysis_example ()
-        quick_screening_example ()
+        # Fetch and analyze the union of all example tickers once
+        shared = build_shared_analyzer ()
+
+        examples = [
+            partial ( example, shared=shared ) for example in (
+                basic_analysis_example,
+                custom_stocks_example,
+                step_by_step_example,
+                sector_analysis_example,
+                quick_screening_example
+            )
+        ]
+
+        # Run all examples concurrently, printing each one's output in order
+        # once it has finished
+        with ThreadPoolExecutor ( max_workers=len ( examples ) ) as executor:
+            for output in executor.map ( _run_buffered, examples ):
+                print ( output, end='' )
 
         print ( "\n" + "=" * 80 )
         print ( "ALL EXAMPLES COMPLETED SUCCESSFULLY!" )
@@ -271,6 +580,9 @@ def main():
         print ( f"Error running examples: {str ( e )}" )
         print ( "Please check your internet connection and try again." )
 
+    finally:
+        sys.stdout = stdout
+
 
 if __name__ == "__main__":
     main ()
\ No newline at end of file
@@ -6,10 +6,34 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import seaborn as sns
+from joblib import Parallel, delayed
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple, List
 import warnings
+import importlib.util
 import logging
+import os
+import re
+
+from _njit import NUMBA_AVAILABLE, njit
+
+try:
+    import bottleneck as bn
+
+    BOTTLENECK_AVAILABLE = True
+
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+try:
+    import talib
+
+    TALIB_AVAILABLE = True
+
+except ImportError:
+    TALIB_AVAILABLE = False
 
 warnings.filterwarnings ( 'ignore' )
 
@@ -20,6 +44,479 @@ plt.style.use ( 'seaborn-v0_8' )
 logging.basicConfig ( level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s' )
 logger = logging.getLogger ( __name__ )
 
+# Upper bound on concurrent Yahoo Finance requests per fetch
+MAX_FETCH_THREADS = 10
+
+# Price columns stored in single precision after cleaning
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+# Columns added by calculate_technical_indicators
+INDICATOR_COLUMNS = ['MA_50', 'MA_200', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Histogram',
+                     'BB_Middle', 'BB_Upper', 'BB_Lower', 'Volatility', 'Price_Change_Pct']
+
+# Latest values trend analysis reads, in the order they are unpacked
+LATEST_FIELDS = ['Close', 'MA_50', 'MA_200', 'RSI', 'MACD', 'MACD_Signal', 'BB_Upper', 'BB_Lower', 'Volatility']
+
+# Signal scores; each one is also its contribution to the composite score
+MA_STRONG_BULLISH, MA_BULLISH, MA_BEARISH, MA_STRONG_BEARISH = 2, 1, -1, -2
+RSI_OVERSOLD, RSI_NEUTRAL, RSI_OVERBOUGHT = 1, 0, -1
+MACD_BULLISH, MACD_BEARISH = 1, -1
+
+# Report labels for each signal score
+MA_LABELS = {MA_STRONG_BULLISH: "Strong Bullish", MA_BULLISH: "Bullish",
+             MA_BEARISH: "Bearish", MA_STRONG_BEARISH: "Strong Bearish"}
+RSI_LABELS = {RSI_OVERSOLD: "Oversold", RSI_NEUTRAL: "Neutral", RSI_OVERBOUGHT: "Overbought"}
+MACD_LABELS = {MACD_BULLISH: "Bullish", MACD_BEARISH: "Bearish"}
+
+# Recommendation for each composite score from -3 to +3
+RECOMMENDATIONS = ('Strong Sell', 'Strong Sell', 'Sell', 'Hold', 'Buy', 'Strong Buy', 'Strong Buy')
+
+# Trailing bars used for latest-value indicators; EMA weights older than this
+# are below float64 resolution
+LATEST_LOOKBACK = 600
+
+# Upper bound on concurrent chart file writes
+MAX_WRITE_THREADS = 4
+
+# Points kept per line for the display-only chart overlays (moving averages, bands)
+MAX_CHART_POINTS = 1000
+
+# The on-disk cache needs a parquet engine
+PARQUET_AVAILABLE = any ( importlib.util.find_spec ( engine ) is not None for engine in ('pyarrow', 'fastparquet') )
+
+
+@njit ( cache=True, nogil=True )
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of ``threshold`` points chosen by Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with the previous pick and the mean
+    of the next bucket, which preserves the visual shape of the line.
+    """
+    n = x.shape[0]
+    if threshold >= n or threshold < 3:
+        return np.arange ( n )
+
+    picked = np.empty ( threshold, dtype=np.int64 )
+    picked[0] = 0
+    picked[threshold - 1] = n - 1
+    bucket = (n - 2) / (threshold - 2)
+    previous = 0
+    for i in range ( threshold - 2 ):
+        start = int ( i * bucket ) + 1
+        end = int ( (i + 1) * bucket ) + 1
+        next_end = min ( int ( (i + 2) * bucket ) + 1, n )
+        mean_x = x[end:next_end].mean ()
+        mean_y = y[end:next_end].mean ()
+
+        best_area = -1.0
+        best = start
+        for j in range ( start, end ):
+            area = abs ( (x[previous] - mean_x) * (y[j] - y[previous])
+                         - (x[previous] - x[j]) * (mean_y - y[previous]) )
+            if area > best_area:
+                best_area = area
+                best = j
+        picked[i + 1] = best
+        previous = best
+    return picked
+
+
+# Windows tracked by the fused kernel, in the order of its running sums
+_FUSED_WINDOWS = (20, 30, 50, 200)
+
+# Rows returned by _indicators_loop
+FUSED_INDICATORS = ('MA_50', 'MA_200', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Histogram',
+                    'BB_Middle', 'BB_Upper', 'BB_Lower', 'Volatility', 'Price_Change_Pct')
+
+# Row of each indicator in the _indicators_loop output
+_MA_50_ROW = FUSED_INDICATORS.index ( 'MA_50' )
+_MA_200_ROW = FUSED_INDICATORS.index ( 'MA_200' )
+_RSI_ROW = FUSED_INDICATORS.index ( 'RSI' )
+_MACD_ROW = FUSED_INDICATORS.index ( 'MACD' )
+_MACD_SIGNAL_ROW = FUSED_INDICATORS.index ( 'MACD_Signal' )
+_MACD_HISTOGRAM_ROW = FUSED_INDICATORS.index ( 'MACD_Histogram' )
+_BB_MIDDLE_ROW = FUSED_INDICATORS.index ( 'BB_Middle' )
+_BB_UPPER_ROW = FUSED_INDICATORS.index ( 'BB_Upper' )
+_BB_LOWER_ROW = FUSED_INDICATORS.index ( 'BB_Lower' )
+_VOLATILITY_ROW = FUSED_INDICATORS.index ( 'Volatility' )
+_PRICE_CHANGE_ROW = FUSED_INDICATORS.index ( 'Price_Change_Pct' )
+
+
+# error_model='numpy' gives inf/NaN on division by zero, as the pandas path does
+@njit ( cache=True, nogil=True, error_model='numpy' )
+def _indicators_loop(close: np.ndarray) -> np.ndarray:
+    """
+    Every indicator for one series in a single pass over ``close``.
+
+    Keeps running sums (with NaN counts) for the 20/30/50/200-day windows,
+    running sums of squares for the 20/30-day deviations, the RSI gain/loss
+    sums and the EMA accumulators, so each price is read once. Values match
+    the pandas path: NaN until a window is full or while it holds a NaN,
+    sample (ddof=1) deviations and adjust=True EMAs.
+
+    Returns:
+        np.ndarray: Shape (len(FUSED_INDICATORS), n), rows in that order
+    """
+    n = close.shape[0]
+    out = np.full ( (len ( FUSED_INDICATORS ), n), np.nan )
+
+    # Deviations are taken around the first valid price so the sums of
+    # squares stay small and a flat window gives exactly zero
+    shift = 0.0
+    for i in range ( n ):
+        if not np.isnan ( close[i] ):
+            shift = close[i]
+            break
+
+    sums = np.zeros ( 4 )
+    squares = np.zeros ( 4 )
+    nan_counts = np.zeros ( 4, dtype=np.int64 )
+
+    gain_sum = 0.0
+    loss_sum = 0.0
+    gain_count = 0
+    loss_count = 0
+
+    decay12 = 1.0 - 2.0 / 13.0
+    decay26 = 1.0 - 2.0 / 27.0
+    decay9 = 1.0 - 2.0 / 10.0
+    ema12_sum = ema12_weight = 0.0
+    ema26_sum = ema26_weight = 0.0
+    signal_sum = signal_weight = 0.0
+
+    for i in range ( n ):
+        value = close[i] - shift
+
+        # Rolling windows
+        for k in range ( 4 ):
+            window = _FUSED_WINDOWS[k]
+            if np.isnan ( value ):
+                nan_counts[k] += 1
+            else:
+                sums[k] += value
+                squares[k] += value * value
+            if i >= window:
+                old = close[i - window] - shift
+                if np.isnan ( old ):
+                    nan_counts[k] -= 1
+                else:
+                    sums[k] -= old
+                    squares[k] -= old * old
+
+        if i >= 49 and nan_counts[2] == 0:
+            out[_MA_50_ROW, i] = sums[2] / 50 + shift
+        if i >= 199 and nan_counts[3] == 0:
+            out[_MA_200_ROW, i] = sums[3] / 200 + shift
+        if i >= 19 and nan_counts[0] == 0:
+            out[_BB_MIDDLE_ROW, i] = sums[0] / 20 + shift
+            deviation = np.sqrt ( max ( 0.0, (squares[0] - sums[0] * sums[0] / 20) / 19 ) )
+            out[_BB_UPPER_ROW, i] = out[_BB_MIDDLE_ROW, i] + deviation * 2
+            out[_BB_LOWER_ROW, i] = out[_BB_MIDDLE_ROW, i] - deviation * 2
+        if i >= 29 and nan_counts[1] == 0:
+            out[_VOLATILITY_ROW, i] = np.sqrt ( max ( 0.0, (squares[1] - sums[1] * sums[1] / 30) / 29 ) )
+
+        # RSI (14), as in _rsi
+        if i > 0:
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                gain_sum += delta
+                gain_count += 1
+            elif delta < 0:
+                loss_sum -= delta
+                loss_count += 1
+            out[_PRICE_CHANGE_ROW, i] = (close[i] / close[i - 1] - 1) * 100
+        if i - 14 > 0:
+            delta = close[i - 14] - close[i - 15]
+            if delta > 0:
+                gain_sum -= delta
+                gain_count -= 1
+            elif delta < 0:
+                loss_sum += delta
+                loss_count -= 1
+        if gain_count == 0:
+            gain_sum = 0.0
+        if loss_count == 0:
+            loss_sum = 0.0
+        if i >= 13:
+            if loss_sum > 0.0:
+                out[_RSI_ROW, i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+            elif gain_sum > 0.0:
+                out[_RSI_ROW, i] = 100.0
+
+        # MACD, as in _ema
+        ema12_sum *= decay12
+        ema12_weight *= decay12
+        ema26_sum *= decay26
+        ema26_weight *= decay26
+        if not np.isnan ( close[i] ):
+            ema12_sum += close[i]
+            ema12_weight += 1.0
+            ema26_sum += close[i]
+            ema26_weight += 1.0
+        signal_sum *= decay9
+        signal_weight *= decay9
+        if ema12_weight > 0.0:
+            macd = ema12_sum / ema12_weight - ema26_sum / ema26_weight
+            out[_MACD_ROW, i] = macd
+            signal_sum += macd
+            signal_weight += 1.0
+        if signal_weight > 0.0:
+            out[_MACD_SIGNAL_ROW, i] = signal_sum / signal_weight
+            out[_MACD_HISTOGRAM_ROW, i] = out[_MACD_ROW, i] - out[_MACD_SIGNAL_ROW, i]
+
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) up front rather than on first use
+    _warmup = np.arange ( 32, dtype=np.float64 )
+    _lttb_indices ( _warmup, _warmup, 8 )
+    # Blocks arrive in single precision
+    _indicators_loop ( _warmup.astype ( np.float32 ) )
+
+
+def _apply_kernel(values: np.ndarray, kernel, *args) -> np.ndarray:
+    """Run a 1-D TA-Lib function over every row of ``values``."""
+    result = np.empty ( values.shape, dtype=np.float64 )
+    for i in range ( values.shape[0] ):
+        result[i] = kernel ( values[i], *args )
+    return result
+
+
+def _rolling(values: np.ndarray, window: int):
+    """pandas rolling window over each row of ``values``, for the pandas fallbacks."""
+    return pd.DataFrame ( values.T ).rolling ( window=window )
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample standard deviation, via Bottleneck or TA-Lib when available."""
+    # Bottleneck rejects windows longer than the series; the others return NaN
+    if BOTTLENECK_AVAILABLE and window <= values.shape[1]:
+        # One Welford pass over the whole block; float32 accumulation drifts by whole percents
+        return bn.move_std ( values.astype ( np.float64 ), window, min_count=window, axis=1, ddof=1 )
+    if TALIB_AVAILABLE:
+        # TA-Lib's STDDEV is the population deviation; rescale to pandas' ddof=1
+        population = _apply_kernel ( values.astype ( np.float64 ), talib.STDDEV, window, 1.0 )
+        return population * np.sqrt ( window / (window - 1) )
+    return _rolling ( values, window ).std ().to_numpy ().T
+
+
+def _sma(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average, using Bottleneck or TA-Lib when available."""
+    if BOTTLENECK_AVAILABLE and window <= values.shape[1]:
+        return bn.move_mean ( values.astype ( np.float64 ), window, min_count=window, axis=1 )
+    if TALIB_AVAILABLE:
+        # TA-Lib only accepts float64 input
+        return _apply_kernel ( values.astype ( np.float64 ), talib.SMA, window )
+    return _rolling ( values, window ).mean ().to_numpy ().T
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average, matching pandas ``ewm(span=span).mean()`` (adjust=True)."""
+    return pd.DataFrame ( values.T ).ewm ( span=span ).mean ().to_numpy ().T
+
+
+def _rsi(close: np.ndarray, window: int) -> np.ndarray:
+    """Relative Strength Index from simple moving averages of gains and losses."""
+    delta = pd.DataFrame ( close.T ).diff ()
+    gain = delta.where ( delta > 0, 0 ).rolling ( window=window ).mean ()
+    loss = (-delta.where ( delta < 0, 0 )).rolling ( window=window ).mean ()
+    rs = gain / loss
+    return (100 - (100 / (1 + rs))).to_numpy ().T
+
+
+def _compute_indicators(close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Calculate technical indicators for a block of close prices.
+
+    Every row is one stock's series and all rows share the same dates, so
+    each kernel walks contiguous memory and the arithmetic between
+    indicators is a single array operation over the whole block. Kept at
+    module level so it can be pickled and run in a worker process.
+
+    Intermediate results are float64; the returned indicators are float32
+    like the prices they were computed from.
+
+    With Numba every row goes through the fused single-pass kernel instead,
+    so Bottleneck and TA-Lib are only used without it.
+
+    Args:
+        close: C-contiguous float32 close prices shaped (n_symbols, n_days)
+
+    Returns:
+        Dict[str, np.ndarray]: Indicator name -> float32 values shaped like ``close``
+    """
+    if NUMBA_AVAILABLE:
+        fused = np.empty ( (len ( FUSED_INDICATORS ),) + close.shape, dtype=np.float32 )
+        for row in range ( close.shape[0] ):
+            fused[:, row] = _indicators_loop ( close[row] )
+        return dict ( zip ( FUSED_INDICATORS, fused ) )
+
+    indicators = {}
+
+    # Moving Averages
+    indicators['MA_50'] = _sma ( close, 50 )
+    indicators['MA_200'] = _sma ( close, 200 )
+
+    # RSI Calculation (TA-Lib's RSI uses Wilder smoothing, so it is not used here)
+    indicators['RSI'] = _rsi ( close, 14 )
+
+    # MACD Calculation (TA-Lib seeds its EMA with an SMA, so it is not used here)
+    exp12 = _ema ( close, 12 )
+    exp26 = _ema ( close, 26 )
+    indicators['MACD'] = exp12 - exp26
+    indicators['MACD_Signal'] = _ema ( indicators['MACD'], 9 )
+    indicators['MACD_Histogram'] = indicators['MACD'] - indicators['MACD_Signal']
+
+    # Bollinger Bands
+    indicators['BB_Middle'] = _sma ( close, 20 )
+    bb_std = _rolling_std ( close, 20 )
+    indicators['BB_Upper'] = indicators['BB_Middle'] + (bb_std * 2)
+    indicators['BB_Lower'] = indicators['BB_Middle'] - (bb_std * 2)
+
+    # Price Volatility (30-day)
+    indicators['Volatility'] = _rolling_std ( close, 30 )
+
+    # Price Change Percentage
+    change = np.full ( close.shape, np.nan )
+    change[:, 1:] = (np.divide ( close[:, 1:], close[:, :-1], dtype=np.float64 ) - 1) * 100
+    indicators['Price_Change_Pct'] = change
+
+    return {name: values.astype ( np.float32 ) for name, values in indicators.items ()}
+
+
+def _window_indicators(close: np.ndarray) -> Dict[str, float]:
+    """
+    Last-bar values of the fixed-window indicators (moving averages, RSI, bands, volatility).
+
+    Only the final 200 prices can affect the result.
+
+    Args:
+        close: One stock's float64 close prices in date order
+
+    Returns:
+        Dict[str, float]: Column name -> value for the last bar
+    """
+    n = close.shape[0]
+
+    def window_mean(window: int) -> float:
+        return close[-window:].mean () if n >= window else np.nan
+
+    def window_std(window: int) -> float:
+        return close[-window:].std ( ddof=1 ) if n >= window else np.nan
+
+    latest = {'Close': close[-1], 'MA_50': window_mean ( 50 ), 'MA_200': window_mean ( 200 )}
+
+    # RSI over the last 14 deltas; like the full series, a missing delta counts as no move
+    rsi = np.nan
+    if n >= 14:
+        delta = np.diff ( close[-15:] )
+        with np.errstate ( divide='ignore', invalid='ignore' ):
+            gain = np.where ( delta > 0, delta, 0 ).sum ()
+            loss = np.where ( delta < 0, -delta, 0 ).sum ()
+            rsi = 100 - (100 / (1 + gain / loss))
+    latest['RSI'] = rsi
+
+    latest['BB_Middle'] = window_mean ( 20 )
+    bb_std = window_std ( 20 )
+    latest['BB_Upper'] = latest['BB_Middle'] + (bb_std * 2)
+    latest['BB_Lower'] = latest['BB_Middle'] - (bb_std * 2)
+    latest['Volatility'] = window_std ( 30 )
+
+    return latest
+
+
+def _latest_indicators(close: np.ndarray) -> Dict[str, float]:
+    """
+    Compute only the last-bar indicator values that trend analysis reads.
+
+    Windowed indicators use just their final window and the EMAs run over
+    the trailing ``LATEST_LOOKBACK`` bars, so no full-length series is kept.
+
+    Args:
+        close: One stock's close prices in date order
+
+    Returns:
+        Dict[str, float]: Column name -> value, matching ``data.iloc[-1]`` after
+        ``calculate_technical_indicators``
+    """
+    close = close[-LATEST_LOOKBACK:].astype ( np.float64 )
+    latest = _window_indicators ( close )
+
+    macd = _ema ( close[None, :], 12 ) - _ema ( close[None, :], 26 )
+    latest['MACD'] = macd[0, -1]
+    latest['MACD_Signal'] = _ema ( macd, 9 )[0, -1]
+
+    return latest
+
+
+def _advance_macd(state: List[float], price: float) -> Tuple[float, float]:
+    """
+    Advance adjust=True EMA accumulators by one price.
+
+    Args:
+        state: [sum12, weight12, sum26, weight26, sum9, weight9], updated in place
+        price: The new close
+
+    Returns:
+        Tuple[float, float]: MACD and signal line values after ``price``
+    """
+    for k, span in enumerate ( (12, 26, 9) ):
+        decay = 1.0 - 2.0 / (span + 1.0)
+        state[2 * k] *= decay
+        state[2 * k + 1] *= decay
+
+    if not np.isnan ( price ):
+        for k in (0, 2):
+            state[k] += price
+            state[k + 1] += 1.0
+
+    macd = signal = np.nan
+    if state[1] > 0.0:
+        macd = state[0] / state[1] - state[2] / state[3]
+        state[4] += macd
+        state[5] += 1.0
+    if state[5] > 0.0:
+        signal = state[4] / state[5]
+    return macd, signal
+
+
+def _completed_sessions(data: pd.DataFrame, now: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """Drop bars from the current (possibly still trading) session, dated today or later."""
+    if now is None:
+        now = pd.Timestamp.now ( tz=data.index.tz )
+    return data[data.index < now.normalize ()]
+
+
+def _period_start(period: str, end: pd.Timestamp) -> Optional[pd.Timestamp]:
+    """First date covered by a yfinance ``period`` ending at ``end`` (None for 'max')."""
+    if period == 'ytd':
+        return end.normalize () - pd.offsets.YearBegin ( 1 )
+    match = re.fullmatch ( r'(\d+)(d|mo|y)', period )
+    if not match:
+        return None
+    count, unit = int ( match.group ( 1 ) ), match.group ( 2 )
+    if unit == 'd':
+        return end - pd.DateOffset ( days=count )
+    if unit == 'mo':
+        return end - pd.DateOffset ( months=count )
+    return end - pd.DateOffset ( years=count )
+
+
+def _group_by_index(stock_data: Dict[str, pd.DataFrame]) -> List[List[str]]:
+    """Group symbols whose price histories share an identical date index."""
+    groups: List[List[str]] = []
+    for symbol, data in stock_data.items ():
+        for group in groups:
+            if stock_data[group[0]].index.equals ( data.index ):
+                group.append ( symbol )
+                break
+        else:
+            groups.append ( [symbol] )
+    return groups
+
 
 class StockAnalyzer:
     """
@@ -33,29 +530,44 @@ class StockAnalyzer:
     - Create detailed analysis reports
     """
 
-    def __init__(self, custom_stocks: Optional[Dict[str, str]] = None):
+    # Stocks analyzed when no custom selection is given
+    DEFAULT_STOCKS: Dict[str, str] = {
+        'AAPL': 'Apple Inc. - Technology',
+        'MSFT': 'Microsoft Corporation - Technology',
+        'AMZN': 'Amazon.com Inc. - Consumer Discretionary',
+        'TSLA': 'Tesla Inc. - Consumer Discretionary',
+        'NVDA': 'NVIDIA Corporation - Technology',
+        'JNJ': 'Johnson & Johnson - Healthcare',
+        'JPM': 'JPMorgan Chase & Co. - Financial',
+        'XOM': 'Exxon Mobil Corporation - Energy',
+        'PG': 'Procter & Gamble Co. - Consumer Staples',
+        'WMT': 'Walmart Inc. - Consumer Staples',
+        'AMT': 'American Tower Corporation - Real Estate'
+    }
+
+    def __init__(self, custom_stocks: Optional[Dict[str, str]] = None,
+                 max_workers: Optional[int] = None, cache_dir: Optional[str] = None):
         """
         Initialize the StockAnalyzer with default or custom stock symbols.
 
         Args:
             custom_stocks: Dictionary of {symbol: description} for custom analysis
+            max_workers: Worker processes for indicator calculation (defaults to CPU count, 1 disables)
+            cache_dir: Directory for parquet caches of prices and indicators (None disables)
         """
-        self.stocks = custom_stocks if custom_stocks else {
-            'AAPL': 'Apple Inc. - Technology',
-            'MSFT': 'Microsoft Corporation - Technology',
-            'AMZN': 'Amazon.com Inc. - Consumer Discretionary',
-            'TSLA': 'Tesla Inc. - Consumer Discretionary',
-            'NVDA': 'NVIDIA Corporation - Technology',
-            'JNJ': 'Johnson & Johnson - Healthcare',
-            'JPM': 'JPMorgan Chase & Co. - Financial',
-            'XOM': 'Exxon Mobil Corporation - Energy',
-            'PG': 'Procter & Gamble Co. - Consumer Staples',
-            'WMT': 'Walmart Inc. - Consumer Staples',
-            'AMT': 'American Tower Corporation - Real Estate'
-        }
-
+        self.stocks = custom_stocks if custom_stocks else dict ( self.DEFAULT_STOCKS )
+
+        self.max_workers = max_workers
+        if cache_dir and not PARQUET_AVAILABLE:
+            logger.warning ( "pyarrow or fastparquet is required for the data cache; caching disabled" )
+            cache_dir = None
+        self.cache_dir = cache_dir
+        if self.cache_dir:
+            os.makedirs ( self.cache_dir, exist_ok=True )
         self.stock_data: Dict[str, pd.DataFrame] = {}
         self.analysis_results: Dict[str, Dict] = {}
+        # Running indicator state per symbol for update_with_new_bar
+        self._bar_state: Dict[str, Dict] = {}
 
     def fetch_stock_data(self, period: str = '5y') -> bool:
         """
@@ -69,25 +581,96 @@ class StockAnalyzer:
         """
         logger.info ( "Fetching stock data..." )
 
-        successful_fetches = 0
-        for symbol in self.stocks.keys ():
-            try:
-                ticker = yf.Ticker ( symbol )
-                data = ticker.history ( period=period )
-
-                if not data.empty:
-                    self.stock_data[symbol] = data
-                    logger.info ( f"✓ {symbol}: {len ( data )} records fetched successfully" )
-                    successful_fetches += 1
-                else:
-                    logger.warning ( f"✗ {symbol}: No data retrieved" )
+        # Requests are network-bound, so overlap them across threads
+        symbols = list ( self.stocks.keys () )
+        workers = max ( 1, min ( len ( symbols ), MAX_FETCH_THREADS ) )
+        with ThreadPoolExecutor ( max_workers=workers ) as executor:
+            results = list ( executor.map ( lambda symbol: self._fetch_symbol ( symbol, period ), symbols ) )
 
-            except Exception as e:
-                logger.error ( f"✗ {symbol}: Error fetching data - {str ( e )}" )
+        successful_fetches = 0
+        for symbol, data in zip ( symbols, results ):
+            if data is not None:
+                self.stock_data[symbol] = data
+                successful_fetches += 1
 
         logger.info ( f"Data fetching complete: {successful_fetches}/{len ( self.stocks )} stocks retrieved" )
         return successful_fetches > 0
 
+    def _fetch_symbol(self, symbol: str, period: str) -> Optional[pd.DataFrame]:
+        """
+        Fetch one symbol's history, logging the outcome.
+
+        Returns:
+            Optional[pd.DataFrame]: The price history, or None if nothing was retrieved
+        """
+        try:
+            if self.cache_dir:
+                data = self._fetch_cached_history ( symbol, period )
+            else:
+                data = self._download_history ( symbol, period )
+
+            if not data.empty:
+                logger.info ( f"✓ {symbol}: {len ( data )} records fetched successfully" )
+                return data
+
+            logger.warning ( f"✗ {symbol}: No data retrieved" )
+
+        except Exception as e:
+            logger.error ( f"✗ {symbol}: Error fetching data - {str ( e )}" )
+
+        return None
+
+    def _download_history(self, symbol: str, period: str) -> pd.DataFrame:
+        """Download price history for a single symbol from Yahoo Finance."""
+        return yf.Ticker ( symbol ).history ( period=period )
+
+    def _download_since(self, symbol: str, start: pd.Timestamp) -> pd.DataFrame:
+        """Download price history for a single symbol from ``start`` (inclusive) onwards."""
+        return yf.Ticker ( symbol ).history ( start=start.strftime ( '%Y-%m-%d' ) )
+
+    def _cache_path(self, symbol: str, kind: str) -> str:
+        """Path of a symbol's parquet cache file, e.g. ``cache/AAPL_5y.parquet``."""
+        return os.path.join ( self.cache_dir, f"{symbol}_{kind}.parquet" )
+
+    def _fetch_cached_history(self, symbol: str, period: str) -> pd.DataFrame:
+        """
+        Fetch price history through the on-disk cache, downloading only new rows.
+
+        The last cached bar is downloaded again. If Yahoo Finance now reports a
+        different close for it, the prices have been re-adjusted (splits or
+        dividends) and the full period is downloaded again. The current
+        session's bar is never cached, since its close is still moving and
+        would not match on the next run.
+
+        Returns:
+            pd.DataFrame: The price history covering ``period``
+        """
+        path = self._cache_path ( symbol, period )
+        data = None
+
+        if os.path.exists ( path ):
+            cached = pd.read_parquet ( path )
+            fresh = self._download_since ( symbol, cached.index[-1] )
+            if fresh.empty:
+                data = cached
+            elif fresh.index[0] == cached.index[-1] and np.isclose ( fresh['Close'].iloc[0],
+                                                                     cached['Close'].iloc[-1] ):
+                data = pd.concat ( [cached.iloc[:-1], fresh] )
+
+            if data is not None:
+                start = _period_start ( period, data.index[-1] )
+                if start is not None:
+                    data = data[data.index >= start]
+                logger.debug ( f"{symbol}: cached history extended to {data.index[-1].date ()}" )
+
+        if data is None:
+            data = self._download_history ( symbol, period )
+
+        completed = _completed_sessions ( data )
+        if not completed.empty:
+            completed.to_parquet ( path )
+        return data
+
     def clean_and_preprocess_data(self) -> None:
         """
         Clean and preprocess the fetched stock data.
@@ -106,18 +689,28 @@ class StockAnalyzer:
                 logger.info ( f"{symbol}: Found {missing_values.sum ()} missing values" )
 
             # Forward fill missing values, then backward fill if needed
-            data_cleaned = data.fillna ( method='ffill' ).fillna ( method='bfill' )
+            data_cleaned = data.ffill ().bfill ()
 
             # Detect price anomalies (changes > 50%)
-            price_changes = data_cleaned['Close'].pct_change ().abs ()
-            outliers = price_changes > 0.5
+            close = data_cleaned['Close'].to_numpy ( dtype=np.float64 )
+            outliers = np.zeros ( close.shape[0], dtype=bool )
+            with np.errstate ( divide='ignore', invalid='ignore' ):
+                outliers[1:] = np.abs ( np.diff ( close ) / close[:-1] ) > 0.5
 
-            if outliers.sum () > 0:
+            if outliers.any ():
                 logger.info ( f"{symbol}: Found {outliers.sum ()} potential outliers" )
-                # Smooth outliers using rolling mean
-                data_cleaned.loc[outliers, 'Close'] = (
-                    data_cleaned['Close'].rolling ( window=3, center=True ).mean ()
-                )
+                # Smooth outliers using the centred 3-day mean, evaluated only at the
+                # outliers; it is undefined on the last day (the first is never an outlier)
+                idx = np.flatnonzero ( outliers )
+                inner = idx[idx < close.shape[0] - 1]
+                smoothed = close.copy ()
+                smoothed[idx] = np.nan
+                smoothed[inner] = (close[inner - 1] + close[inner] + close[inner + 1]) / 3.0
+                data_cleaned['Close'] = smoothed
+
+            # Single precision halves the bytes every indicator pass reads
+            price_columns = [column for column in PRICE_COLUMNS if column in data_cleaned.columns]
+            data_cleaned[price_columns] = data_cleaned[price_columns].astype ( np.float32 )
 
             self.stock_data[symbol] = data_cleaned
 
@@ -127,6 +720,12 @@ class StockAnalyzer:
         """
         Calculate comprehensive technical indicators for all stocks.
 
+        Close prices of stocks sharing a date index are stacked into one
+        (n_symbols, n_days) array so each indicator is computed for all of
+        them in a single pass.
+        With more than one worker the blocks are split across joblib's loky
+        process pool.
+
         Indicators calculated:
         - Moving Averages (50, 200 day)
         - RSI (Relative Strength Index)
@@ -136,41 +735,132 @@ class StockAnalyzer:
         """
         logger.info ( "Calculating technical indicators..." )
 
+        # Recomputed series invalidate any incremental state
+        self._bar_state.clear ()
+
+        # Reuse cached indicators for symbols whose prices have not changed
+        pending = {}
         for symbol, data in self.stock_data.items ():
-            # Moving Averages
-            data['MA_50'] = data['Close'].rolling ( window=50 ).mean ()
-            data['MA_200'] = data['Close'].rolling ( window=200 ).mean ()
-
-            # RSI Calculation
-            delta = data['Close'].diff ()
-            gain = delta.where ( delta > 0, 0 ).rolling ( window=14 ).mean ()
-            loss = (-delta.where ( delta < 0, 0 )).rolling ( window=14 ).mean ()
-            rs = gain / loss
-            data['RSI'] = 100 - (100 / (1 + rs))
-
-            # MACD Calculation
-            exp12 = data['Close'].ewm ( span=12 ).mean ()
-            exp26 = data['Close'].ewm ( span=26 ).mean ()
-            data['MACD'] = exp12 - exp26
-            data['MACD_Signal'] = data['MACD'].ewm ( span=9 ).mean ()
-            data['MACD_Histogram'] = data['MACD'] - data['MACD_Signal']
-
-            # Bollinger Bands
-            data['BB_Middle'] = data['Close'].rolling ( window=20 ).mean ()
-            bb_std = data['Close'].rolling ( window=20 ).std ()
-            data['BB_Upper'] = data['BB_Middle'] + (bb_std * 2)
-            data['BB_Lower'] = data['BB_Middle'] - (bb_std * 2)
-
-            # Price Volatility (30-day)
-            data['Volatility'] = data['Close'].rolling ( window=30 ).std ()
-
-            # Price Change Percentage
-            data['Price_Change_Pct'] = data['Close'].pct_change () * 100
-
-            logger.info ( f"✓ {symbol}: Technical indicators calculated" )
+            cached = self._load_cached_indicators ( symbol, data ) if self.cache_dir else None
+            if cached is not None:
+                self.stock_data[symbol] = cached
+                logger.info ( f"✓ {symbol}: Technical indicators loaded from cache" )
+            else:
+                pending[symbol] = data
+
+        workers = max ( 1, min ( self.max_workers or os.cpu_count () or 1, len ( pending ) ) )
+
+        # Split each index group into at most one block per worker, stacking the
+        # close prices symbol-major so every series is a contiguous row
+        block_symbols: List[List[str]] = []
+        blocks: List[np.ndarray] = []
+        for group in _group_by_index ( pending ):
+            for chunk in np.array_split ( np.array ( group, dtype=object ), min ( workers, len ( group ) ) ):
+                block_symbols.append ( list ( chunk ) )
+                blocks.append ( np.stack ( [pending[symbol]['Close'].to_numpy ( dtype=np.float32 )
+                                            for symbol in chunk] ) )
+
+        if workers > 1 and len ( blocks ) > 1:
+            # loky workers are reused across calls and do not inherit the parent's threads
+            results = Parallel ( n_jobs=workers, backend='loky' ) (
+                delayed ( _compute_indicators ) ( block ) for block in blocks )
+        else:
+            results = [_compute_indicators ( block ) for block in blocks]
+
+        for symbols, indicators in zip ( block_symbols, results ):
+            for row, symbol in enumerate ( symbols ):
+                data = self.stock_data[symbol]
+                for name, values in indicators.items ():
+                    data[name] = values[row]
+                if self.cache_dir:
+                    data.to_parquet ( self._cache_path ( symbol, 'indicators' ) )
+                logger.info ( f"✓ {symbol}: Technical indicators calculated" )
 
         logger.info ( "Technical indicators calculation completed" )
 
+    def _load_cached_indicators(self, symbol: str, data: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Load a symbol's cached indicator frame if it was computed from ``data``.
+
+        Returns:
+            Optional[pd.DataFrame]: ``data`` with indicator columns, or None if the cache is missing or stale
+        """
+        path = self._cache_path ( symbol, 'indicators' )
+        if not os.path.exists ( path ):
+            return None
+
+        cached = pd.read_parquet ( path )
+        if not set ( data.columns ).issubset ( cached.columns ) or not cached[data.columns].equals ( data ):
+            return None
+        return cached
+
+    def update_with_new_bar(self, symbol: str, bar: pd.Series) -> pd.Series:
+        """
+        Append one new price bar to a symbol and compute its indicators incrementally.
+
+        The first call for a symbol seeds running state from its history. Later
+        calls update the EMA accumulators in O(1) and read the fixed windows
+        from the last 200 closes, so the cost does not grow with the history.
+        Call analyze_trends afterwards to refresh the signals.
+
+        Args:
+            symbol: Symbol whose indicators have been calculated
+            bar: New bar named by its timestamp, with at least a 'Close' value.
+                Missing Open/High/Low default to the close and Volume to 0. A
+                tz-naive timestamp is taken to be in the history's time zone.
+
+        Returns:
+            pd.Series: The appended row, including its indicator values
+
+        Raises:
+            ValueError: If indicators have not been calculated, or the bar has
+                no close, no valid timestamp, or is not after the last bar
+        """
+        data = self.stock_data.get ( symbol )
+        if data is None or not set ( INDICATOR_COLUMNS ).issubset ( data.columns ):
+            raise ValueError ( f"{symbol}: calculate_technical_indicators must run before adding bars" )
+        if pd.isna ( bar.get ( 'Close' ) ):
+            raise ValueError ( f"{symbol}: bar has no 'Close' value" )
+        try:
+            timestamp = pd.Timestamp ( bar.name )
+            # yfinance indexes are tz-aware while hand-built bars usually are not
+            if timestamp.tz is None:
+                timestamp = timestamp.tz_localize ( data.index.tz )
+            else:
+                timestamp = timestamp.tz_convert ( data.index.tz )
+        except Exception as e:
+            raise ValueError ( f"{symbol}: bar name {bar.name!r} is not a timestamp: {e}" ) from e
+        if pd.isna ( timestamp ):
+            raise ValueError ( f"{symbol}: bar must be named by its timestamp, e.g. pd.Series ( ..., name=ts )" )
+        if timestamp <= data.index[-1]:
+            raise ValueError ( f"{symbol}: bar at {timestamp} is not after the last bar {data.index[-1]}" )
+
+        state = self._bar_state.get ( symbol )
+        if state is None:
+            history = data['Close'].to_numpy ( dtype=np.float64 )
+            state = {'closes': deque ( history[-200:], maxlen=200 ), 'macd': [0.0] * 6}
+            for price in history[-LATEST_LOOKBACK:]:
+                _advance_macd ( state['macd'], price )
+            self._bar_state[symbol] = state
+
+        # Round to the stored precision so the result matches a full recompute
+        close = float ( np.asarray ( bar['Close'], dtype=data['Close'].dtype ) )
+        previous = state['closes'][-1]
+        state['closes'].append ( close )
+
+        values = _window_indicators ( np.fromiter ( state['closes'], dtype=np.float64 ) )
+        values['MACD'], values['MACD_Signal'] = _advance_macd ( state['macd'], close )
+        values['MACD_Histogram'] = values['MACD'] - values['MACD_Signal']
+        values['Price_Change_Pct'] = (close / previous - 1) * 100
+
+        # A close-only bar has no range or volume; fill them so the integer Volume cast holds
+        defaults = {column: close for column in PRICE_COLUMNS}
+        defaults['Volume'] = 0
+        row = pd.Series ( {**defaults, **bar.dropna ().to_dict (), **values} ).reindex ( data.columns )
+        new_row = pd.DataFrame ( [row], index=[timestamp] ).astype ( data.dtypes.to_dict () )
+        self.stock_data[symbol] = pd.concat ( [data, new_row] )
+        return self.stock_data[symbol].iloc[-1]
+
     def analyze_trends(self) -> None:
         """
         Perform comprehensive trend analysis for all stocks.
@@ -181,123 +871,123 @@ class StockAnalyzer:
         - MACD momentum signals
         - Bollinger band position
         - Overall recommendation scoring
+
+        Uses the indicator columns when calculate_technical_indicators has
+        run; otherwise only the latest values are computed from the closes.
         """
         logger.info ( "Starting trend analysis..." )
 
         for symbol, data in self.stock_data.items ():
-            latest = data.iloc[-1]
-            analysis = self._analyze_single_stock ( latest )
-            analysis['current_price'] = latest['Close']
-            analysis['volatility'] = latest['Volatility']
+            if set ( INDICATOR_COLUMNS ).issubset ( data.columns ):
+                latest = data.iloc[-1]
+            else:
+                latest = _latest_indicators ( data['Close'].to_numpy () )
+
+            # Unbox the latest values once instead of indexing by label in every signal helper
+            (close, ma50, ma200, rsi, macd, macd_signal,
+             bb_upper, bb_lower, volatility) = [float ( latest[field] ) for field in LATEST_FIELDS]
+
+            analysis = self._analyze_single_stock ( close, ma50, ma200, rsi, macd, macd_signal, bb_upper, bb_lower )
+            analysis['current_price'] = close
+            analysis['volatility'] = volatility
+            analysis['sector'] = self._get_sector ( symbol )
 
             self.analysis_results[symbol] = analysis
 
         logger.info ( "Trend analysis completed" )
 
-    def _analyze_single_stock(self, latest_data: pd.Series) -> Dict:
+    def _get_sector(self, symbol: str) -> Optional[str]:
+        """Extract the sector from a '<Company> - <Sector>' stock description."""
+        description = self.stocks[symbol]
+        return description.rsplit ( ' - ', 1 )[1] if ' - ' in description else None
+
+    def _analyze_single_stock(self, close: float, ma50: float, ma200: float, rsi: float,
+                              macd: float, macd_signal: float, bb_upper: float, bb_lower: float) -> Dict:
         """
         Analyze a single stock's latest data point.
 
         Args:
-            latest_data: Latest data point for the stock
+            close: Latest close price
+            ma50: Latest 50-day moving average
+            ma200: Latest 200-day moving average
+            rsi: Latest RSI value
+            macd: Latest MACD line value
+            macd_signal: Latest MACD signal line value
+            bb_upper: Latest upper Bollinger Band
+            bb_lower: Latest lower Bollinger Band
 
         Returns:
             Dict: Analysis results including signals and recommendations
         """
         # Moving Average Signal
-        ma_signal = self._get_ma_signal ( latest_data )
+        ma_score = self._get_ma_signal ( close, ma50, ma200 )
 
         # RSI Signal
-        rsi_value = latest_data['RSI']
-        rsi_signal = self._get_rsi_signal ( rsi_value )
+        rsi_score = self._get_rsi_signal ( rsi )
 
         # MACD Signal
-        macd_signal = self._get_macd_signal ( latest_data )
+        macd_score = self._get_macd_signal ( macd, macd_signal )
 
         # Bollinger Bands Signal
-        bb_signal = self._get_bb_signal ( latest_data )
+        bb_signal = self._get_bb_signal ( close, bb_upper, bb_lower )
 
         # Calculate composite score (-3 to +3)
-        score = self._calculate_composite_score ( ma_signal, rsi_signal, macd_signal )
+        score = self._calculate_composite_score ( ma_score, rsi_score, macd_score )
 
         # Generate recommendation
         recommendation = self._get_recommendation ( score )
 
         return {
-            'ma_signal': ma_signal,
-            'rsi_value': rsi_value,
-            'rsi_signal': rsi_signal,
-            'macd_signal': macd_signal,
+            'ma_signal': MA_LABELS[ma_score],
+            'rsi_value': rsi,
+            'rsi_signal': RSI_LABELS[rsi_score],
+            'macd_signal': MACD_LABELS[macd_score],
             'bb_signal': bb_signal,
             'score': score,
             'recommendation': recommendation
         }
 
-    def _get_ma_signal(self, data: pd.Series) -> str:
-        """Generate moving average signal."""
-        close, ma50, ma200 = data['Close'], data['MA_50'], data['MA_200']
-
+    def _get_ma_signal(self, close: float, ma50: float, ma200: float) -> int:
+        """Generate moving average signal, scored -2 (strong bearish) to +2 (strong bullish)."""
         if close > ma50 > ma200:
-            return "Strong Bullish"
+            return MA_STRONG_BULLISH
         elif close > ma50:
-            return "Bullish"
+            return MA_BULLISH
         elif close < ma50 < ma200:
-            return "Strong Bearish"
+            return MA_STRONG_BEARISH
         else:
-            return "Bearish"
+            return MA_BEARISH
 
-    def _get_rsi_signal(self, rsi: float) -> str:
-        """Generate RSI signal."""
+    def _get_rsi_signal(self, rsi: float) -> int:
+        """Generate RSI signal, scored -1 (overbought) to +1 (oversold)."""
         if rsi > 70:
-            return "Overbought"
+            return RSI_OVERBOUGHT
         elif rsi < 30:
-            return "Oversold"
+            return RSI_OVERSOLD
         else:
-            return "Neutral"
+            return RSI_NEUTRAL
 
-    def _get_macd_signal(self, data: pd.Series) -> str:
-        """Generate MACD signal."""
-        return "Bullish" if data['MACD'] > data['MACD_Signal'] else "Bearish"
+    def _get_macd_signal(self, macd: float, macd_signal: float) -> int:
+        """Generate MACD signal, scored +1 (bullish) or -1 (bearish)."""
+        return MACD_BULLISH if macd > macd_signal else MACD_BEARISH
 
-    def _get_bb_signal(self, data: pd.Series) -> str:
+    def _get_bb_signal(self, close: float, bb_upper: float, bb_lower: float) -> str:
         """Generate Bollinger Bands signal."""
-        close = data['Close']
-        if close > data['BB_Upper']:
+        if close > bb_upper:
             return "Above upper band - potentially overbought"
-        elif close < data['BB_Lower']:
+        elif close < bb_lower:
             return "Below lower band - potentially oversold"
         else:
             return "Within normal range"
 
-    def _calculate_composite_score(self, ma_signal: str, rsi_signal: str, macd_signal: str) -> int:
+    def _calculate_composite_score(self, ma_signal: int, rsi_signal: int, macd_signal: int) -> int:
         """Calculate composite score based on all signals."""
-        score = 0
-
-        # MA Score
-        if "Bullish" in ma_signal:
-            score += 2 if "Strong" in ma_signal else 1
-        elif "Bearish" in ma_signal:
-            score -= 2 if "Strong" in ma_signal else 1
-
-        # RSI Score
-        if rsi_signal == "Overbought":
-            score -= 1
-        elif rsi_signal == "Oversold":
-            score += 1
-
-        # MACD Score
-        score += 1 if macd_signal == "Bullish" else -1
-
-        return max ( -3, min ( 3, score ) )
+        # Each signal value is already its score contribution
+        return max ( -3, min ( 3, ma_signal + rsi_signal + macd_signal ) )
 
     def _get_recommendation(self, score: int) -> str:
         """Generate investment recommendation based on composite score."""
-        recommendations = {
-            3: "Strong Buy", 2: "Strong Buy",
-            1: "Buy", 0: "Hold",
-            -1: "Sell", -2: "Strong Sell", -3: "Strong Sell"
-        }
-        return recommendations.get ( score, "Hold" )
+        return RECOMMENDATIONS[score + 3]
 
     def create_visualizations(self) -> None:
         """
@@ -310,9 +1000,16 @@ class StockAnalyzer:
         """
         logger.info ( "Generating visualizations..." )
 
-        # Create individual stock charts
-        for symbol, data in self.stock_data.items ():
-            self._create_stock_chart ( symbol, data )
+        # The charts need full indicator series, which trend analysis alone does not compute
+        if not all ( set ( INDICATOR_COLUMNS ).issubset ( data.columns ) for data in self.stock_data.values () ):
+            self.calculate_technical_indicators ()
+
+        # Create individual stock charts; figures are built here and serialized to
+        # disk on a thread pool so writing one overlaps with the next
+        figures = [(symbol, self._build_stock_chart ( symbol, data )) for symbol, data in self.stock_data.items ()]
+        workers = max ( 1, min ( len ( figures ), MAX_WRITE_THREADS ) )
+        with ThreadPoolExecutor ( max_workers=workers ) as executor:
+            list ( executor.map ( lambda item: self._write_stock_chart ( *item ), figures ) )
 
         # Create comparison charts
         self._create_comparison_charts ()
@@ -322,11 +1019,11 @@ class StockAnalyzer:
 
         logger.info ( "Visualization generation completed" )
 
-    def _create_stock_chart(self, symbol: str, data: pd.DataFrame) -> None:
-        """Create detailed technical analysis chart for a single stock."""
+    def _build_stock_chart(self, symbol: str, data: pd.DataFrame) -> go.Figure:
+        """Build the technical analysis dashboard figure for a single stock."""
         fig = make_subplots (
             rows=4, cols=1,
-            shared_xaxis=True,
+            shared_xaxes=True,
             vertical_spacing=0.05,
             subplot_titles=(
                 f'{symbol} - {self.stocks[symbol]} Price Action',
@@ -351,36 +1048,39 @@ class StockAnalyzer:
             row=1, col=1
         )
 
+        # Moving averages and bands are overlays on the candles, so a decimated line is enough
+        overlay = self._decimate ( data, ['MA_50', 'MA_200', 'BB_Upper', 'BB_Lower'] )
+
         # Moving averages
         fig.add_trace (
-            go.Scatter ( x=data.index, y=data['MA_50'], name='MA50',
-                         line=dict ( color='orange', width=1 ) ),
+            go.Scattergl ( x=overlay.index, y=overlay['MA_50'], name='MA50',
+                           line=dict ( color='orange', width=1 ) ),
             row=1, col=1
         )
 
         fig.add_trace (
-            go.Scatter ( x=data.index, y=data['MA_200'], name='MA200',
-                         line=dict ( color='red', width=1 ) ),
+            go.Scattergl ( x=overlay.index, y=overlay['MA_200'], name='MA200',
+                           line=dict ( color='red', width=1 ) ),
             row=1, col=1
         )
 
         # Bollinger Bands
         fig.add_trace (
-            go.Scatter ( x=data.index, y=data['BB_Upper'], name='BB Upper',
-                         line=dict ( color='gray', dash='dash', width=1 ) ),
+            go.Scattergl ( x=overlay.index, y=overlay['BB_Upper'], name='BB Upper',
+                           line=dict ( color='gray', dash='dash', width=1 ) ),
             row=1, col=1
         )
 
         fig.add_trace (
-            go.Scatter ( x=data.index, y=data['BB_Lower'], name='BB Lower',
-                         line=dict ( color='gray', dash='dash', width=1 ) ),
+            go.Scattergl ( x=overlay.index, y=overlay['BB_Lower'], name='BB Lower',
+                           line=dict ( color='gray', dash='dash', width=1 ) ),
             row=1, col=1
         )
 
         # RSI
         fig.add_trace (
-            go.Scatter ( x=data.index, y=data['RSI'], name='RSI',
-                         line=dict ( color='purple' ) ),
+            go.Scattergl ( x=data.index, y=data['RSI'], name='RSI',
+                           line=dict ( color='purple' ) ),
             row=2, col=1
         )
         fig.add_hline ( y=70, line_dash="dash", line_color="red", row=2, col=1 )
@@ -388,13 +1088,13 @@ class StockAnalyzer:
 
         # MACD
         fig.add_trace (
-            go.Scatter ( x=data.index, y=data['MACD'], name='MACD',
-                         line=dict ( color='blue' ) ),
+            go.Scattergl ( x=data.index, y=data['MACD'], name='MACD',
+                           line=dict ( color='blue' ) ),
             row=3, col=1
         )
         fig.add_trace (
-            go.Scatter ( x=data.index, y=data['MACD_Signal'], name='Signal',
-                         line=dict ( color='red' ) ),
+            go.Scattergl ( x=data.index, y=data['MACD_Signal'], name='Signal',
+                           line=dict ( color='red' ) ),
             row=3, col=1
         )
         fig.add_trace (
@@ -418,16 +1118,47 @@ class StockAnalyzer:
             template='plotly_white'
         )
 
-        fig.write_html ( f'{symbol}_technical_analysis.html' )
+        return fig
+
+    def _write_stock_chart(self, symbol: str, fig: go.Figure) -> None:
+        """Write a stock's dashboard figure to ``<symbol>_technical_analysis.html``."""
+        # Load plotly.js from the CDN instead of embedding ~4 MB of it in every file
+        fig.write_html ( f'{symbol}_technical_analysis.html', include_plotlyjs='cdn' )
+
+    def _decimate(self, data: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """
+        Downsample ``columns`` of ``data`` to at most MAX_CHART_POINTS rows for display.
+
+        Rows are picked with LTTB on each column and the union is kept, so every
+        line retains its own peaks and troughs.
+        """
+        if len ( data ) <= MAX_CHART_POINTS:
+            return data[columns]
+
+        x = data.index.asi8.astype ( np.float64 )
+        keep = np.zeros ( len ( data ), dtype=bool )
+        for column in columns:
+            y = data[column].to_numpy ( dtype=np.float64 )
+            keep[_lttb_indices ( x, y, MAX_CHART_POINTS // len ( columns ) )] = True
+        return data.loc[keep, columns]
 
     def _create_comparison_charts(self) -> None:
         """Create comparative analysis charts for all stocks."""
         fig, axes = plt.subplots ( 2, 2, figsize=(16, 12) )
 
+        # Gather the per-stock endpoints once as aligned vectors
+        symbols = list ( self.stock_data.keys () )
+        frames = list ( self.stock_data.values () )
+        first_close = np.array ( [data['Close'].iat[0] for data in frames], dtype=np.float64 )
+        last_close = np.array ( [data['Close'].iat[-1] for data in frames], dtype=np.float64 )
+        volatilities = np.array ( [data['Volatility'].iat[-1] for data in frames], dtype=np.float64 )
+        current_rsi = np.array ( [data['RSI'].iat[-1] for data in frames], dtype=np.float64 )
+        days = np.array ( [(data.index[-1] - data.index[0]).days for data in frames], dtype=np.float64 )
+
         # Normalized price comparison
         ax1 = axes[0, 0]
-        for symbol, data in self.stock_data.items ():
-            normalized_price = (data['Close'] / data['Close'].iloc[0]) * 100
+        for symbol, data, base in zip ( symbols, frames, first_close ):
+            normalized_price = (data['Close'] / base) * 100
             ax1.plot ( data.index, normalized_price, label=symbol, alpha=0.8, linewidth=2 )
         ax1.set_title ( 'Normalized Price Comparison (Base = 100)', fontsize=14, fontweight='bold' )
         ax1.set_ylabel ( 'Normalized Price' )
@@ -436,8 +1167,6 @@ class StockAnalyzer:
 
         # Volatility comparison
         ax2 = axes[0, 1]
-        volatilities = [data['Volatility'].iloc[-1] for data in self.stock_data.values ()]
-        symbols = list ( self.stock_data.keys () )
         colors = plt.cm.viridis ( np.linspace ( 0, 1, len ( symbols ) ) )
         bars = ax2.bar ( symbols, volatilities, color=colors, alpha=0.8 )
         ax2.set_title ( '30-Day Volatility Comparison', fontsize=14, fontweight='bold' )
@@ -446,7 +1175,6 @@ class StockAnalyzer:
 
         # Current RSI comparison
         ax3 = axes[1, 0]
-        current_rsi = [data['RSI'].iloc[-1] for data in self.stock_data.values ()]
         bars = ax3.bar ( symbols, current_rsi, color=colors, alpha=0.8 )
         ax3.axhline ( y=70, color='r', linestyle='--', alpha=0.7, label='Overbought' )
         ax3.axhline ( y=30, color='g', linestyle='--', alpha=0.7, label='Oversold' )
@@ -457,15 +1185,9 @@ class StockAnalyzer:
 
         # Annualized returns comparison
         ax4 = axes[1, 1]
-        annual_returns = []
-        for symbol, data in self.stock_data.items ():
-            start_price = data['Close'].iloc[0]
-            end_price = data['Close'].iloc[-1]
-            days = (data.index[-1] - data.index[0]).days
-            annual_return = ((end_price / start_price) ** (365 / days) - 1) * 100
-            annual_returns.append ( annual_return )
+        annual_returns = (np.power ( last_close / first_close, 365 / days ) - 1) * 100
 
-        colors_return = ['green' if x > 0 else 'red' for x in annual_returns]
+        colors_return = np.where ( annual_returns > 0, 'green', 'red' )
         bars = ax4.bar ( symbols, annual_returns, color=colors_return, alpha=0.8 )
         ax4.set_title ( 'Annualized Returns Comparison', fontsize=14, fontweight='bold' )
         ax4.set_ylabel ( 'Annualized Return (%)' )
@@ -478,13 +1200,16 @@ class StockAnalyzer:
 
     def _create_correlation_analysis(self) -> pd.DataFrame:
         """Create correlation analysis heatmap."""
-        # Build price matrix
-        price_data = pd.DataFrame ()
-        for symbol, data in self.stock_data.items ():
-            price_data[symbol] = data['Close']
+        # Build price matrix, aligning every history on date in one pass
+        price_data = pd.concat ( {symbol: data['Close'] for symbol, data in self.stock_data.items ()}, axis=1 )
+        prices = price_data.to_numpy ( dtype=np.float64 )
 
-        # Calculate correlation matrix
-        correlation_matrix = price_data.corr ()
+        # Calculate correlation matrix; gaps need pandas' pairwise-complete handling
+        if np.isnan ( prices ).any ():
+            correlation_matrix = price_data.corr ()
+        else:
+            correlation_matrix = pd.DataFrame ( np.corrcoef ( prices, rowvar=False ),
+                                                index=price_data.columns, columns=price_data.columns )
 
         # Create heatmap
         plt.figure ( figsize=(12, 10) )
@@ -527,13 +1252,20 @@ class StockAnalyzer:
             ""
         ] )
 
+        # Tally recommendations and group sectors in a single pass over the results
+        recommendation_counts = Counter ()
+        sectors = defaultdict ( list )
+        for symbol, analysis in self.analysis_results.items ():
+            recommendation_counts[analysis['recommendation']] += 1
+            if analysis['sector']:
+                sectors[analysis['sector']].append ( symbol )
+
         # Executive Summary
-        buy_signals = sum ( 1 for analysis in self.analysis_results.values ()
-                            if "Buy" in analysis['recommendation'] )
-        sell_signals = sum ( 1 for analysis in self.analysis_results.values ()
-                             if "Sell" in analysis['recommendation'] )
-        hold_signals = sum ( 1 for analysis in self.analysis_results.values ()
-                             if analysis['recommendation'] == "Hold" )
+        buy_signals = sum ( count for recommendation, count in recommendation_counts.items ()
+                            if "Buy" in recommendation )
+        sell_signals = sum ( count for recommendation, count in recommendation_counts.items ()
+                             if "Sell" in recommendation )
+        hold_signals = recommendation_counts["Hold"]
 
         report_lines.extend ( [
             "EXECUTIVE SUMMARY",
@@ -570,18 +1302,11 @@ class StockAnalyzer:
             "-" * 40
         ] )
 
-        sectors = {}
-        for symbol, description in self.stocks.items ():
-            if ' - ' in description:
-                sector = description.split ( ' - ' )[1]
-                if sector not in sectors:
-                    sectors[sector] = []
-                sectors[sector].append ( symbol )
-
         for sector, symbols in sectors.items ():
             if len ( symbols ) > 1:
-                sector_scores = [self.analysis_results[symbol]['score'] for symbol in symbols]
-                avg_score = sum ( sector_scores ) / len ( sector_scores )
+                sector_scores = np.fromiter ( (self.analysis_results[symbol]['score'] for symbol in symbols),
+                                              dtype=np.int32, count=len ( symbols ) )
+                avg_score = sector_scores.mean ()
                 report_lines.extend ( [
                     f"{sector} Sector Average Score: {avg_score:.1f}",
                     f"Stocks: {', '.join ( symbols )}",
@@ -620,10 +1345,13 @@ class StockAnalyzer:
         logger.info ( "Analysis report saved as 'stock_analysis_report.txt'" )
         return report_text
 
-    def run_complete_analysis(self) -> str:
+    def run_complete_analysis(self, make_plots: bool = True) -> str:
         """
         Execute the complete analysis workflow.
 
+        Args:
+            make_plots: Generate chart files; disable when only the text report is needed
+
         Returns:
             str: Analysis report
         """
@@ -636,18 +1364,23 @@ class StockAnalyzer:
                 raise Exception ( "Failed to fetch stock data" )
 
             self.clean_and_preprocess_data ()
-            self.calculate_technical_indicators ()
+            # Full indicator series are only needed for the charts; computing them
+            # first keeps the report's signals on the same values the charts show
+            if make_plots:
+                self.calculate_technical_indicators ()
             self.analyze_trends ()
-            self.create_visualizations ()
+            if make_plots:
+                self.create_visualizations ()
             report = self.generate_report ()
 
             logger.info ( "=" * 80 )
             logger.info ( "Analysis completed successfully!" )
             logger.info ( "Generated files:" )
             logger.info ( "1. stock_analysis_report.txt - Detailed analysis report" )
-            logger.info ( "2. stock_comparison_analysis.png - Comparative charts" )
-            logger.info ( "3. correlation_heatmap.png - Correlation analysis" )
-            logger.info ( "4. [SYMBOL]_technical_analysis.html - Individual stock charts" )
+            if make_plots:
+                logger.info ( "2. stock_comparison_analysis.png - Comparative charts" )
+                logger.info ( "3. correlation_heatmap.png - Correlation analysis" )
+                logger.info ( "4. [SYMBOL]_technical_analysis.html - Individual stock charts" )
             logger.info ( "=" * 80 )
 
             return report
@@ -0,0 +1,45 @@
+"""Shared fixtures for the stock analyzer tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import stock_analyzer as sa
+
+
+class OfflineAnalyzer(sa.StockAnalyzer):
+    """Analyzer fed with synthetic histories instead of Yahoo Finance."""
+
+    def __init__(self, histories, **kwargs):
+        super ().__init__ ( custom_stocks={symbol: f'{symbol} Co - Technology' for symbol in histories},
+                            max_workers=1, **kwargs )
+        self.histories = histories
+
+    def _download_history(self, symbol, period):
+        return self.histories[symbol].copy ()
+
+
+def make_prices(n: int, seed: int = 0, start: str = '2020-01-01') -> pd.DataFrame:
+    """Synthetic daily OHLCV history shaped like a yfinance download."""
+    rng = np.random.default_rng ( seed )
+    close = 100 + np.cumsum ( rng.normal ( size=n ) )
+    index = pd.bdate_range ( start, periods=n, tz='America/New_York' )
+    return pd.DataFrame ( {
+        'Open': close + rng.normal ( 0, 0.1, size=n ),
+        'High': close + 1.0,
+        'Low': close - 1.0,
+        'Close': close,
+        'Volume': rng.integers ( 1_000_000, 5_000_000, size=n ),
+    }, index=index )
+
+
+@pytest.fixture
+def prices():
+    """Factory for synthetic price histories."""
+    return make_prices
+
+
+@pytest.fixture
+def offline_analyzer():
+    """Factory for analyzers over synthetic histories."""
+    return OfflineAnalyzer
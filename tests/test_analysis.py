@@ -0,0 +1,22 @@
+"""Tests for the end-to-end analysis workflow."""
+
+import pytest
+
+import stock_analyzer as sa
+
+
+@pytest.mark.parametrize ( 'make_plots', [False, True] )
+def test_run_complete_analysis_signals_match_indicator_columns(prices, offline_analyzer, tmp_path, monkeypatch, make_plots):
+    """With charts, the report's signals are read from the charted indicator series."""
+    monkeypatch.chdir ( tmp_path )
+    analyzer = offline_analyzer ( {'AAA': prices ( 400, seed=1 ), 'BBB': prices ( 400, seed=2 )} )
+    monkeypatch.setattr ( analyzer, 'create_visualizations', lambda: None )
+
+    analyzer.run_complete_analysis ( make_plots=make_plots )
+
+    for symbol, data in analyzer.stock_data.items ():
+        assert set ( sa.INDICATOR_COLUMNS ).issubset ( data.columns ) == make_plots
+        if make_plots:
+            analysis = analyzer.analysis_results[symbol]
+            assert analysis['rsi_value'] == float ( data['RSI'].iloc[-1] )
+            assert analysis['volatility'] == float ( data['Volatility'].iloc[-1] )
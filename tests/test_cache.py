@@ -0,0 +1,81 @@
+"""Tests for the on-disk parquet price cache."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import stock_analyzer as sa
+
+pytest.importorskip ( 'pyarrow' )
+
+
+class RecordingAnalyzer(sa.StockAnalyzer):
+    """Analyzer that serves a fixed history and records each download."""
+
+    def __init__(self, source: pd.DataFrame, **kwargs):
+        super ().__init__ ( custom_stocks={'AAA': 'A Co - Technology'}, max_workers=1, **kwargs )
+        self.source = source
+        self.calls = []
+
+    def _download_history(self, symbol, period):
+        self.calls.append ( 'full' )
+        return self.source.copy ()
+
+    def _download_since(self, symbol, start):
+        self.calls.append ( 'since' )
+        return self.source[self.source.index >= start].copy ()
+
+
+def _fetch(source, cache_dir, period='5y'):
+    analyzer = RecordingAnalyzer ( source, cache_dir=str ( cache_dir ) )
+    data = analyzer._fetch_cached_history ( 'AAA', period )
+    return analyzer, data
+
+
+def test_cache_appends_new_bars(prices, tmp_path):
+    full = prices ( 300 )
+    _fetch ( full.iloc[:-5], tmp_path )
+
+    analyzer, data = _fetch ( full, tmp_path )
+
+    assert analyzer.calls == ['since']
+    pd.testing.assert_frame_equal ( data, full, check_freq=False )
+
+
+def test_cache_redownloads_when_prices_are_readjusted(prices, tmp_path):
+    full = prices ( 300 )
+    _fetch ( full.iloc[:-5], tmp_path )
+    adjusted = full.copy ()
+    adjusted['Close'] *= 0.5
+
+    analyzer, data = _fetch ( adjusted, tmp_path )
+
+    assert analyzer.calls == ['since', 'full']
+    pd.testing.assert_frame_equal ( data, adjusted, check_freq=False )
+
+
+def test_cache_trims_to_period(prices, tmp_path):
+    full = prices ( 600 )
+    _fetch ( full.iloc[:-5], tmp_path, period='1y' )
+
+    analyzer, data = _fetch ( full, tmp_path, period='1y' )
+
+    assert analyzer.calls == ['since']
+    assert data.index[0] >= full.index[-1] - pd.DateOffset ( years=1 )
+    assert data.index[-1] == full.index[-1]
+
+
+def test_cache_skips_current_session(prices, tmp_path):
+    today = pd.Timestamp.now ( tz='America/New_York' ).normalize ()
+    intraday = prices ( 300 )
+    intraday.index = pd.date_range ( end=today, periods=len ( intraday ), freq='D' )
+    _fetch ( intraday, tmp_path )
+    assert pd.read_parquet ( tmp_path / 'AAA_5y.parquet' ).index[-1] < today
+
+    settled = intraday.copy ()
+    settled.iloc[-1, settled.columns.get_loc ( 'Close' )] += 3.0
+    analyzer, data = _fetch ( settled, tmp_path )
+
+    assert analyzer.calls == ['since']
+    assert data['Close'].iloc[-1] == settled['Close'].iloc[-1]
+    assert np.array_equal ( data.index, settled.index )
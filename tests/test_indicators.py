@@ -0,0 +1,72 @@
+"""Tests for the indicator calculations."""
+
+import numpy as np
+import pytest
+
+import stock_analyzer as sa
+
+LATEST_COLUMNS = ['MA_50', 'MA_200', 'RSI', 'MACD', 'MACD_Signal',
+                  'BB_Middle', 'BB_Upper', 'BB_Lower', 'Volatility']
+
+
+@pytest.mark.parametrize ( 'n', [150, 400, 1300] )
+@pytest.mark.parametrize ( 'leading_nans', [0, 10] )
+def test_latest_indicators_match_full_series(prices, n, leading_nans):
+    """Latest-only values equal the last row of the full indicator series."""
+    close = prices ( n, seed=n ).astype ( {'Close': np.float32} )['Close'].to_numpy ()
+    close[:leading_nans] = np.nan
+
+    full = sa._compute_indicators ( close[None, :] )
+    latest = sa._latest_indicators ( close )
+
+    assert latest['Close'] == pytest.approx ( close[-1] )
+    for column in LATEST_COLUMNS:
+        expected = full[column][0, -1]
+        if np.isnan ( expected ):
+            assert np.isnan ( latest[column] ), column
+        else:
+            assert latest[column] == pytest.approx ( expected, rel=1e-5, abs=1e-5 ), column
+
+
+def test_latest_indicators_short_series_leaves_long_windows_undefined(prices):
+    """A series shorter than 200 bars has no 200-day average."""
+    close = prices ( 150 )['Close'].to_numpy ()
+
+    latest = sa._latest_indicators ( close )
+
+    assert np.isnan ( latest['MA_200'] )
+    assert not np.isnan ( latest['MA_50'] )
+
+
+@pytest.mark.skipif ( not sa.NUMBA_AVAILABLE, reason='fused kernel needs Numba' )
+@pytest.mark.parametrize ( 'leading_nans', [0, 10] )
+def test_fused_kernel_matches_fallback_path(prices, monkeypatch, leading_nans):
+    """The fused Numba kernel gives the same indicators as the per-indicator path."""
+    close = np.stack ( [prices ( 500, seed=seed )['Close'].to_numpy ( dtype=np.float32 ) for seed in range ( 3 )] )
+    close[:, :leading_nans] = np.nan
+
+    fused = sa._compute_indicators ( close )
+    monkeypatch.setattr ( sa, 'NUMBA_AVAILABLE', False )
+    fallback = sa._compute_indicators ( close )
+
+    assert set ( fused ) == set ( fallback ) == set ( sa.INDICATOR_COLUMNS )
+    for column in sa.INDICATOR_COLUMNS:
+        assert fused[column].dtype == fallback[column].dtype == np.float32, column
+        np.testing.assert_allclose ( fused[column], fallback[column], rtol=1e-5, atol=1e-5, err_msg=column )
+
+
+@pytest.mark.skipif ( not sa.NUMBA_AVAILABLE, reason='fused kernel needs Numba' )
+def test_fused_rsi_edge_windows():
+    """Flat windows have no RSI, all-gain windows read 100 and all-loss windows 0."""
+    rises = 100 + np.arange ( 30 ) * 0.37
+    falls = rises[-1] - np.arange ( 1, 31 ) * 0.53
+    flat = np.full ( 30, falls[-1] )
+    close = np.concatenate ( [rises, falls, flat] ).astype ( np.float32 )
+
+    rsi = sa._indicators_loop ( close )[sa._RSI_ROW]
+
+    assert np.isnan ( rsi[:13] ).all ()
+    assert (rsi[14:30] == 100.0).all ()
+    assert (rsi[44:60] == 0.0).all ()
+    # Once every move has left the window the running sums reset, so no drift survives
+    assert np.isnan ( rsi[73:] ).all ()
@@ -0,0 +1,81 @@
+"""Tests for incremental indicator updates."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import stock_analyzer as sa
+
+NEW_BARS = 15
+
+
+def _analyzer(offline_analyzer, histories):
+    analyzer = offline_analyzer ( histories )
+    analyzer.fetch_stock_data ()
+    analyzer.clean_and_preprocess_data ()
+    analyzer.calculate_technical_indicators ()
+    return analyzer
+
+
+@pytest.mark.parametrize ( 'n', [120, 700] )
+def test_update_with_new_bar_matches_full_recompute(prices, offline_analyzer, n):
+    """Bars appended one at a time get the same indicators as a full calculation."""
+    history = prices ( n, seed=n )
+    full = _analyzer ( offline_analyzer, {'AAA': history} ).stock_data['AAA']
+    analyzer = _analyzer ( offline_analyzer, {'AAA': history.iloc[:-NEW_BARS]} )
+
+    for _, bar in history.iloc[-NEW_BARS:].iterrows ():
+        analyzer.update_with_new_bar ( 'AAA', bar )
+
+    updated = analyzer.stock_data['AAA']
+    assert updated.index.equals ( full.index )
+    assert (updated.dtypes == full.dtypes).all ()
+    for column in sa.INDICATOR_COLUMNS:
+        np.testing.assert_allclose ( updated[column].iloc[-NEW_BARS:], full[column].iloc[-NEW_BARS:],
+                                     rtol=1e-5, atol=1e-4, err_msg=column )
+
+
+def test_update_with_close_only_bar(prices, offline_analyzer):
+    """A bar with just a close fills the range from it and records no volume."""
+    history = prices ( 300 )
+    analyzer = _analyzer ( offline_analyzer, {'AAA': history} )
+    timestamp = history.index[-1] + pd.offsets.BDay ()
+
+    row = analyzer.update_with_new_bar ( 'AAA', pd.Series ( {'Close': 101.5}, name=timestamp ) )
+
+    assert row.name == timestamp
+    assert row[['Open', 'High', 'Low', 'Close']].tolist () == [101.5] * 4
+    assert row['Volume'] == 0
+    assert analyzer.stock_data['AAA']['Volume'].dtype == history['Volume'].dtype
+    assert not row[sa.INDICATOR_COLUMNS].isna ().any ()
+
+
+@pytest.mark.parametrize ( 'name', [pd.Timestamp ( '2030-01-02' ), '2030-01-02',
+                                     pd.Timestamp ( '2030-01-02 14:30', tz='UTC' )] )
+def test_update_with_new_bar_reads_timestamp_in_history_time_zone(prices, offline_analyzer, name):
+    """Naive and string timestamps are localized, aware ones converted, to the index time zone."""
+    analyzer = _analyzer ( offline_analyzer, {'AAA': prices ( 300 )} )
+
+    row = analyzer.update_with_new_bar ( 'AAA', pd.Series ( {'Close': 101.5}, name=name ) )
+
+    expected = pd.Timestamp ( name )
+    expected = expected.tz_localize ( 'America/New_York' ) if expected.tz is None else expected
+    assert row.name == expected
+    assert analyzer.stock_data['AAA'].index.tz == prices ( 1 ).index.tz
+    assert analyzer.stock_data['AAA'].index.is_monotonic_increasing
+
+
+@pytest.mark.parametrize ( 'bar, message', [
+    (pd.Series ( {'Close': 101.5} ), 'named by its timestamp'),
+    (pd.Series ( {'Open': 101.0}, name=pd.Timestamp ( '2030-01-02', tz='America/New_York' ) ), "no 'Close'"),
+    (pd.Series ( {'Close': 101.5}, name=pd.Timestamp ( '2020-01-02', tz='America/New_York' ) ), 'not after'),
+    (pd.Series ( {'Close': 101.5}, name=pd.Timestamp ( '2020-01-02' ) ), 'not after'),
+    (pd.Series ( {'Close': 101.5}, name='2020-01-02' ), 'not after'),
+    (pd.Series ( {'Close': 101.5}, name='not a date' ), 'not a timestamp'),
+] )
+def test_update_with_new_bar_rejects_invalid_bars(prices, offline_analyzer, bar, message):
+    """Bars without a valid timestamp or close, or out of order, raise ValueError."""
+    analyzer = _analyzer ( offline_analyzer, {'AAA': prices ( 300 )} )
+    with pytest.raises ( ValueError, match=message ):
+        analyzer.update_with_new_bar ( 'AAA', bar )
+    assert len ( analyzer.stock_data['AAA'] ) == 300